@@ -6,20 +6,30 @@ Versão simplificada usando apenas webhooks - sem dependência do discord.py.
 import aiohttp
 import logging
 import asyncio
+import time
 from typing import Dict, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from config.settings import Settings
+from core.models import ItemData
+from utils.json_utils import dumps_bytes
 
 logger = logging.getLogger(__name__)
 
+# Corpo já serializado (orjson quando disponível) - o Content-Type precisa ir explícito
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 class DiscordPoster:
     """Gerencia postagens no Discord usando webhooks."""
     
+    __slots__ = ('settings', 'webhook_url', 'bot_token', 'channel_id', '_http')
+    
     def __init__(self):
         self.settings = Settings()
         self.webhook_url = self.settings.DISCORD_WEBHOOK_URL
         self.bot_token = self.settings.DISCORD_BOT_TOKEN
         self.channel_id = self.settings.DISCORD_CHANNEL_ID
+        # Sessão HTTP compartilhada entre as postagens (criada no primeiro uso)
+        self._http: Optional[aiohttp.ClientSession] = None
         
         if not self.webhook_url and not self.bot_token:
             logger.warning("⚠️ Discord webhook URL ou bot token não configurado")
@@ -27,12 +37,23 @@ class DiscordPoster:
         if not self.channel_id:
             logger.warning("⚠️ Discord channel ID não configurado")
     
-    async def post_opportunity(self, item: Dict) -> bool:
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Retorna a sessão HTTP compartilhada, criando-a se necessário."""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession()
+        return self._http
+    
+    async def close(self) -> None:
+        """Fecha a sessão HTTP compartilhada."""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+    
+    async def post_opportunity(self, item: ItemData) -> bool:
         """
         Posta uma oportunidade no Discord usando webhook ou bot token.
         
         Args:
-            item: Dicionário com dados do item
+            item: Dados do item
             
         Returns:
             bool: True se enviou com sucesso, False caso contrário
@@ -59,27 +80,25 @@ class DiscordPoster:
             # Envia via webhook ou bot token
             if self.webhook_url:
                 # Usa webhook
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(self.webhook_url, json=payload) as response:
-                        if response.status == 204:
-                            logger.info(f"✅ Oportunidade enviada para Discord via webhook: {item.get('name', 'Unknown')}")
-                            return True
-                        else:
-                            logger.error(f"❌ Erro ao enviar via webhook: {response.status}")
-                            error_text = await response.text()
-                            logger.error(f"❌ Resposta: {error_text}")
-                            return False
+                session = self._get_http_session()
+                async with session.post(self.webhook_url, data=dumps_bytes(payload), headers=_JSON_HEADERS) as response:
+                    if response.status == 204:
+                        logger.info("✅ Oportunidade enviada para Discord via webhook: %s", item.name)
+                        return True
+                    else:
+                        logger.error("❌ Erro ao enviar via webhook: %s", response.status)
+                        error_text = await response.text()
+                        logger.error("❌ Resposta: %s", error_text)
+                        return False
             else:
                 # Usa bot token
                 return await self._send_via_bot_token(payload, item)
                         
         except Exception as e:
-            logger.error(f"❌ Erro ao enviar para Discord: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("❌ Erro ao enviar para Discord: %s", e)
             return False
     
-    async def _send_via_bot_token(self, payload: Dict, item: Dict) -> bool:
+    async def _send_via_bot_token(self, payload: Dict, item: ItemData) -> bool:
         """
         Envia mensagem via bot token do Discord.
         
@@ -94,7 +113,7 @@ class DiscordPoster:
             # Remove campos específicos do webhook
             bot_payload = {
                 "embeds": payload["embeds"],
-                "content": f"🎯 **Nova Oportunidade Encontrada!**\n{item.get('name', 'Unknown')}"
+                "content": f"🎯 **Nova Oportunidade Encontrada!**\n{item.name}"
             }
             
             # Headers para bot token
@@ -106,40 +125,40 @@ class DiscordPoster:
             # URL da API do Discord
             url = f"https://discord.com/api/v10/channels/{self.channel_id}/messages"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=bot_payload, headers=headers) as response:
-                    if response.status == 200:
-                        logger.info(f"✅ Oportunidade enviada para Discord via bot: {item.get('name', 'Unknown')}")
-                        return True
-                    else:
-                        logger.error(f"❌ Erro ao enviar via bot: {response.status}")
-                        error_text = await response.text()
-                        logger.error(f"❌ Resposta: {error_text}")
-                        return False
+            session = self._get_http_session()
+            async with session.post(url, data=dumps_bytes(bot_payload), headers=headers) as response:
+                if response.status == 200:
+                    logger.info("✅ Oportunidade enviada para Discord via bot: %s", item.name)
+                    return True
+                else:
+                    logger.error("❌ Erro ao enviar via bot: %s", response.status)
+                    error_text = await response.text()
+                    logger.error("❌ Resposta: %s", error_text)
+                    return False
                         
         except Exception as e:
-            logger.error(f"❌ Erro ao enviar via bot token: {e}")
+            logger.error("❌ Erro ao enviar via bot token: %s", e)
             return False
     
-    def _create_embed(self, item: Dict) -> Dict:
+    def _create_embed(self, item: ItemData) -> Dict:
         """
         Cria um embed do Discord com as informações do item.
         
         Args:
-            item: Dicionário com dados do item
+            item: Dados do item
             
         Returns:
             Dict: Embed formatado para Discord
         """
         try:
             # Dados básicos do item
-            name = item.get('name', 'Item Desconhecido')
-            price = item.get('price', 0)
-            price_buff163 = item.get('price_buff163')
-            liquidity_score = item.get('liquidity_score')
-            condition = item.get('condition', 'Unknown')
-            marketplace = item.get('marketplace', 'csgoempire')
-            item_id = item.get('id', 'Unknown')
+            name = item.name or 'Item Desconhecido'
+            price = item.price
+            price_buff163 = item.price_buff163
+            liquidity_score = item.liquidity_score
+            condition = item.condition or 'Unknown'
+            marketplace = item.marketplace
+            item_id = item.id
             
             # Calcula lucro se tiver preço do Buff163
             profit_percentage = None
@@ -240,8 +259,8 @@ class DiscordPoster:
                 "inline": True
             })
             
-            # Timestamp
-            timestamp = datetime.now().isoformat()
+            # Timestamp da detecção (ISO com fuso - o Discord assume UTC se ausente)
+            timestamp = datetime.fromtimestamp(item.detected_at or time.time(), timezone.utc).isoformat()
             
             # Embed completo
             embed = {
@@ -262,11 +281,11 @@ class DiscordPoster:
             return embed
             
         except Exception as e:
-            logger.error(f"❌ Erro ao criar embed: {e}")
+            logger.error("❌ Erro ao criar embed: %s", e)
             # Embed de fallback
             return {
                 "title": "❌ Erro ao processar item",
-                "description": f"Item: {item.get('name', 'Unknown')}",
+                "description": f"Item: {item.name}",
                 "color": 0xFF0000,
                 "timestamp": datetime.now().isoformat()
             }
@@ -298,15 +317,15 @@ class DiscordPoster:
                 "avatar_url": "https://i.imgur.com/4M34hi2.png"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.webhook_url, json=test_payload) as response:
-                    if response.status == 204:
-                        logger.info("✅ Webhook do Discord testado com sucesso")
-                        return True
-                    else:
-                        logger.error(f"❌ Erro no teste do webhook: {response.status}")
-                        return False
+            session = self._get_http_session()
+            async with session.post(self.webhook_url, data=dumps_bytes(test_payload), headers=_JSON_HEADERS) as response:
+                if response.status == 204:
+                    logger.info("✅ Webhook do Discord testado com sucesso")
+                    return True
+                else:
+                    logger.error("❌ Erro no teste do webhook: %s", response.status)
+                    return False
                         
         except Exception as e:
-            logger.error(f"❌ Erro ao testar webhook: {e}")
+            logger.error("❌ Erro ao testar webhook: %s", e)
             return False
\ No newline at end of file
@@ -3,59 +3,219 @@ Scanner simples e direto para o CSGOEmpire usando WebSocket.
 Baseado na documentação oficial: https://docs.csgoempire.com/
 """
 import asyncio
+import functools
 import logging
+import math
+import random
 import socketio
+import sys
 import aiohttp
 import time
-import uuid
-from typing import Dict, Optional, List
-from datetime import datetime
+import types
+from collections import deque
+from typing import Deque, Dict, Optional, List, Tuple
 
 from config.settings import Settings
 from utils.supabase_client import SupabaseClient
+from utils.json_utils import json_module
+from utils.ttl_cache import TTLCache
+from utils.batcher import BatchLoader
 from core.discord_poster import DiscordPoster
+from core.models import ItemData
+from filters.profit_filter import ProfitFilter
+from filters.liquidity_filter import LiquidityFilter
 
 logger = logging.getLogger(__name__)
 
+# Condições de desgaste (sempre no final do nome, entre parênteses). Internadas: o parse
+# devolve sempre estes mesmos objetos, e as chaves de cache comparam por identidade.
+_CONDITIONS = frozenset(sys.intern(c) for c in ("Factory New", "Minimal Wear", "Field-Tested", "Well-Worn", "Battle-Scarred"))
+
+# Eventos de trade tratados pelo scanner - o servidor deixa de enviar os demais
+_ALLOWED_EVENTS_PAYLOAD = {'events': ['new_item']}
+
+# Limite do backoff exponencial entre tentativas de reconexão (segundos)
+_BACKOFF_MAX = 60.0
+
+
+def _fast_price_ok(item: Dict, min_centavos: int, max_centavos: int) -> bool:
+    """Filtro de preço em centavos: uma comparação inteira, sem conversão para USD nem logs."""
+    price = item.get('purchase_price')
+    return price is not None and min_centavos <= price <= max_centavos
+
+
+async def _sleep_backoff(backoff: float) -> float:
+    """Aguarda o backoff (com jitter) e retorna o próximo, dobrado até o limite."""
+    delay = min(backoff, _BACKOFF_MAX) * (0.5 + random.random())
+    logger.info("⏳ Aguardando %.1fs antes de reconectar...", delay)
+    await asyncio.sleep(delay)
+    return min(backoff * 2, _BACKOFF_MAX)
+
+
+@functools.lru_cache(maxsize=16384)
+def _parse_market_hash_name(name: str) -> tuple:
+    """Parse do nome do item (função pura - os mesmos nomes se repetem muito no feed)."""
+    try:
+        if not name:
+            return "", False, False, None
+
+        s = name.strip()
+        # Marcadores em qualquer posição do nome (ex.: "... Souvenir Package"), como no parse
+        # original - o nome base e as flags formam as chaves de busca na database
+        stattrak = "StatTrak" in s
+        souvenir = "Souvenir" in s
+        condition = None
+
+        # Condição: último trecho entre parênteses, validado em O(1) no conjunto
+        head, sep, tail = s.rpartition('(')
+        if sep and tail.endswith(')') and tail[:-1] in _CONDITIONS:
+            condition = sys.intern(tail[:-1])
+            s = head.rstrip()
+
+        # Remove as flags (str.replace em C; "★ " é mantido no nome base)
+        base = s.replace("StatTrak™ ", "").replace("StatTrak ", "").replace("Souvenir ", "").strip()
+
+        # Poucos milhares de nomes base distintos - internar não cresce sem limite
+        return sys.intern(base), stattrak, souvenir, condition
+
+    except Exception as e:
+        logger.error("❌ Erro ao fazer parse do nome: %s", e)
+        return name, False, False, None
+
+
 class MarketplaceScanner:
     """
     Scanner simples para o CSGOEmpire usando WebSocket.
     Foca apenas em eventos 'new_item' conforme solicitado.
     """
     
+    # Atributos fixos - acesso mais rápido e sem __dict__ por instância.
+    # Ao adicionar um atributo em __init__, inclua-o aqui.
+    __slots__ = (
+        'settings', 'supabase', 'discord_poster', 'sio', '_profit_filter', '_liquidity_filter',
+        '_auth_event', 'is_connected', 'reconnect_attempts',
+        '_configure_task',
+        '_work_q', '_worker_count', '_workers', '_disconnected',
+        '_discord_q', '_discord_batch_size',
+        'user_id', 'socket_token', 'socket_signature', 'user_model', '_identify_payload',
+        '_filters_payload',
+        'processed_items', 'max_processed_items', 'processed_items_ttl', '_processed_order',
+        '_liquidity_cache', '_buff163_cache', '_enrich_misses', '_liquidity_loader', '_buff163_loader',
+        '_api_headers', '_cents_to_usd', '_min_price', '_max_price', '_min_centavos', '_max_centavos',
+        'health_check_interval', '_http_timeout', '_http',
+    )
+    
     def __init__(self):
         self.settings = Settings()
         self.supabase = SupabaseClient()
         self.discord_poster = DiscordPoster()
         
-        # Socket.IO client
-        self.sio = socketio.AsyncClient()
+        # Filtros de oportunidade - criados uma vez, reutilizados para todos os itens
+        self._profit_filter = ProfitFilter(self.settings.MIN_PROFIT_PERCENTAGE)
+        self._liquidity_filter = LiquidityFilter(self.settings.MIN_LIQUIDITY_SCORE)
+        
+        # Socket.IO client (orjson para decodificar os pacotes, quando disponível)
+        self.sio = socketio.AsyncClient(json=json_module)
         
-        # Estado da conexão
+        # Estado da conexão (authenticated é uma property sobre _auth_event)
+        self._auth_event = asyncio.Event()
         self.is_connected = False
         self.authenticated = False
         self.reconnect_attempts = 0
+        self._configure_task: Optional[asyncio.Task] = None
+        
+        # Fila de itens aguardando processamento - desacopla o WebSocket da database
+        self._work_q: asyncio.Queue = asyncio.Queue(maxsize=500)
+        self._worker_count = 8
+        self._workers: List[asyncio.Task] = []
+        
+        # Oportunidades aguardando postagem - um Discord lento não segura os workers de processamento
+        self._discord_q: asyncio.Queue = asyncio.Queue(maxsize=1024)
+        self._discord_batch_size = 5  # posts simultâneos (limite de rate do webhook é ~5 a cada 2s)
+        
+        # Sinalizado pelo handler 'disconnect' - acorda o monitoramento imediatamente
+        self._disconnected = asyncio.Event()
         
         # Dados de autenticação
         self.user_id = None
         self.socket_token = None
         self.socket_signature = None
         self.user_model = None
+        self._identify_payload: Optional[Dict] = None  # montado quando a metadata é obtida
         
         # Controle de duplicatas - evita processar o mesmo item múltiplas vezes
-        self.processed_items = set()
+        # item_id (int, como enviado pelo CSGOEmpire) -> instante (time.monotonic) em que foi processado
+        self.processed_items: Dict[int, float] = {}
         self.max_processed_items = 1000  # Mantém apenas os últimos 1000 itens processados
+        self.processed_items_ttl = 300  # Segundos até um item poder ser reprocessado
+        # Ordem de inserção (item_id, instante) - o deque limitado faz a evicção FIFO sem varreduras
+        self._processed_order: Deque[Tuple[int, float]] = deque(maxlen=self.max_processed_items)
+        
+        # Cache de scores de liquidez por (base_name, stattrak, souvenir, condição) -
+        # o feed repete as mesmas skins o tempo todo e o score muda pouco
+        self._liquidity_cache = TTLCache(maxsize=4096, ttl=300)
+        
+        # Preços Buff163 mudam na escala de minutos - cache curto para os mesmos itens relistados
+        self._buff163_cache = TTLCache(maxsize=8192, ttl=60)
+        
+        # Cache negativo: itens sem preço Buff163 ou sem liquidez na database nunca passam
+        # nos filtros - evita repetir as mesmas consultas sem resultado por um minuto
+        self._enrich_misses = TTLCache(maxsize=16384, ttl=60)
+        
+        # Consultas à database agrupadas em lotes - uma query por janela (20ms / 50 chaves) em vez de uma por item
+        self._liquidity_loader = BatchLoader(self.supabase.get_liquidity_scores_bulk)
+        self._buff163_loader = BatchLoader(self.supabase.get_buff163_prices_bulk)
+        
+        # Headers HTTP da API do CSGOEmpire - montados uma única vez (a API key não muda)
+        self._api_headers = types.MappingProxyType({
+            "Authorization": f"Bearer {self.settings.CSGOEMPIRE_API_KEY}",
+            "Accept": "application/json",
+            "User-Agent": "Mozilla/5.0"
+        })
+        
+        # Valores de configuração usados por item - evita acessos a self.settings no caminho quente
+        self._cents_to_usd = self.settings.COIN_TO_USD_FACTOR / 100.0  # centavos -> USD em uma multiplicação
+        self._min_price = self.settings.MIN_PRICE
+        self._max_price = self.settings.MAX_PRICE
+        # Mesmos limites em centavos: preço * fator >= mínimo <=> preço >= ceil(mínimo / fator)
+        self._min_centavos = math.ceil(self._min_price / self._cents_to_usd)
+        self._max_centavos = math.floor(self._max_price / self._cents_to_usd)
+        
+        # Filtro de preço enviado ao servidor - CSGOEmpire usa centavos. Mesmo limite do filtro local.
+        self._filters_payload = {'price_max': self._max_centavos}
+        
+        # Intervalo (s) entre verificações de saúde da conexão
+        self.health_check_interval = 30
+        
+        # Timeout das requisições HTTP - evita travar o loop de reconexão
+        self._http_timeout = aiohttp.ClientTimeout(total=10, connect=5, sock_read=5)
+        
+        # Sessão HTTP compartilhada (criada sob demanda dentro do event loop)
+        self._http: Optional[aiohttp.ClientSession] = None
         
         # Log das configurações
         logger.info("🔧 Configurações carregadas:")
-        logger.info(f"   - Preço: ${self.settings.MIN_PRICE:.2f} - ${self.settings.MAX_PRICE:.2f}")
-        logger.info(f"   - Lucro mínimo: {self.settings.MIN_PROFIT_PERCENTAGE:.1f}%")
-        logger.info(f"   - Liquidez mínima: {self.settings.MIN_LIQUIDITY_SCORE:.1f}")
-        logger.info(f"   - Fator conversão: {self.settings.COIN_TO_USD_FACTOR}")
+        logger.info("   - Preço: $%.2f - $%.2f", self.settings.MIN_PRICE, self.settings.MAX_PRICE)
+        logger.info("   - Lucro mínimo: %.1f%%", self.settings.MIN_PROFIT_PERCENTAGE)
+        logger.info("   - Liquidez mínima: %.1f", self.settings.MIN_LIQUIDITY_SCORE)
+        logger.info("   - Fator conversão: %s", self.settings.COIN_TO_USD_FACTOR)
         
         # Configura eventos
         self._setup_socket_events()
     
+    @property
+    def authenticated(self) -> bool:
+        """Se o servidor confirmou a autenticação do WebSocket."""
+        return self._auth_event.is_set()
+    
+    @authenticated.setter
+    def authenticated(self, value: bool) -> None:
+        # Sinaliza quem aguarda em _wait_for_authentication no mesmo instante
+        if value:
+            self._auth_event.set()
+        else:
+            self._auth_event.clear()
+    
     def _setup_socket_events(self):
         """Configura os handlers de eventos do WebSocket."""
         try:
@@ -68,9 +228,12 @@ class MarketplaceScanner:
                 logger.info("🔌 Conectado ao namespace /trade")
                 self.is_connected = True
                 self.authenticated = False
+                self._disconnected.clear()
                 
-                # Configura automaticamente após conectar
-                await self._configure_websocket()
+                # Configura automaticamente após cada conexão (inclusive reconexões automáticas do
+                # python-socketio). Roda em task: o handler é executado dentro do loop de leitura
+                # dos pacotes, e esperar o 'init' aqui bloquearia a própria chegada do 'init'.
+                self._configure_task = asyncio.create_task(self._configure_websocket())
             
             # Handler de desconexão
             @self.sio.event(namespace='/trade')
@@ -79,12 +242,13 @@ class MarketplaceScanner:
                 logger.info("🔌 Desconectado do namespace /trade")
                 self.is_connected = False
                 self.authenticated = False
+                self._disconnected.set()
             
             # Handler de erro
             @self.sio.event(namespace='/trade')
             async def connect_error(data):
                 """Erro de conexão."""
-                logger.error(f"❌ Erro de conexão WebSocket: {data}")
+                logger.error("❌ Erro de conexão WebSocket: %s", data)
                 self.is_connected = False
                 self.authenticated = False
             
@@ -93,33 +257,64 @@ class MarketplaceScanner:
             async def on_new_item(data):
                 """Novo item disponível - APENAS este evento."""
                 try:
-                    logger.info(f"🆕 NOVO ITEM RECEBIDO: {type(data)}")
+                    # Nível de log consultado uma vez por evento, não por item
+                    info_enabled = logger.isEnabledFor(logging.INFO)
+                    debug_enabled = logger.isEnabledFor(logging.DEBUG)
                     
-                    if isinstance(data, list):
-                        logger.info(f"📋 Lista com {len(data)} itens")
-                        for i, item in enumerate(data):
-                            if isinstance(item, dict):
-                                item_name = item.get('market_name', item.get('name', f'Item {i+1}'))
-                                item_id = item.get('id', 'Unknown')
-                                logger.info(f"   🆕 {i+1}. {item_name} (ID: {item_id})")
-                                await self._process_item(item, 'new_item')
-                    elif isinstance(data, dict):
-                        logger.info(f"📋 Item único recebido")
-                        item_name = data.get('market_name', data.get('name', 'Unknown'))
-                        item_id = item.get('id', 'Unknown')
-                        logger.info(f"   🆕 {item_name} (ID: {item_id})")
-                        await self._process_item(data, 'new_item')
+                    # Normaliza o payload uma única vez: lista de itens ou item único.
+                    # Listas são confiadas pelo primeiro elemento - o servidor não mistura tipos.
+                    data_type = data.__class__
+                    if data_type is list:
+                        if not data or data[0].__class__ is not dict:
+                            return
+                        items = data
+                    elif data_type is dict:
+                        items = (data,)
+                    else:
+                        logger.warning("⚠️ Payload new_item inesperado: %s", data_type)
+                        return
+                    
+                    # Filtro de preço sobre o lote inteiro antes de criar qualquer corrotina -
+                    # a maioria dos itens é descartada aqui
+                    min_centavos = self._min_centavos
+                    max_centavos = self._max_centavos
+                    candidates = [item for item in items if _fast_price_ok(item, min_centavos, max_centavos)]
+                    if info_enabled:
+                        logger.info("🆕 new_item: %s itens recebidos, %s na faixa de preço", len(items), len(candidates))
+                    
+                    # Apenas enfileira - enriquecimento, filtros e Discord rodam nos workers,
+                    # então o recebimento do WebSocket nunca espera pela database
+                    # Os campos usados adiante (id, nome, preço) são lidos uma única vez aqui e só eles
+                    # seguem pela fila - o dict bruto do payload não passa deste ponto.
+                    # Métodos usados a cada item ficam em variáveis locais (evita lookups de atributo no loop)
+                    enqueue = self._enqueue_item
+                    claim = self._claim_item
+                    log_debug = logger.debug
+                    for item in candidates:
+                        get = item.get
+                        item_id = get('id')
+                        if item_id is None:
+                            logger.warning("⚠️ Item sem ID, ignorando")
+                            continue
+                        # Sem nome não há como consultar a database - descarta antes de reservar o ID e enfileirar
+                        market_name = get('market_name')
+                        if not market_name:
+                            continue
+                        # Duplicatas (reenvios após reconexão) param aqui, antes de ocupar a fila
+                        if not claim(item_id):
+                            continue
+                        if debug_enabled:
+                            log_debug("   🆕 %s (ID: %s)", market_name, item_id)
+                        enqueue(item_id, market_name, get('purchase_price'), 'new_item')
                     
                 except Exception as e:
-                    logger.error(f"❌ Erro ao processar new_item: {e}")
-                    import traceback
-                    logger.error(f"Traceback: {traceback.format_exc()}")
+                    logger.exception("❌ Erro ao processar new_item: %s", e)
             
             # Handler para erros do servidor
             @self.sio.on('err', namespace='/trade')
             async def on_error(data):
                 """Erro do servidor WebSocket."""
-                logger.warning(f"⚠️ Erro do servidor WebSocket: {data}")
+                logger.warning("⚠️ Erro do servidor WebSocket: %s", data)
                 
                 # Se for erro de autenticação, marca como não autenticado
                 if isinstance(data, dict):
@@ -127,15 +322,16 @@ class MarketplaceScanner:
                     if 'identify failed' in error_msg or 'authentication' in error_msg:
                         logger.error("❌ Falha na autenticação - marcando como não autenticado")
                         self.authenticated = False
-                        # Tenta reconectar
-                        asyncio.create_task(self._reconnect_websocket())
+                        # Acorda o monitoramento do run_forever - ele é o único dono da reconexão
+                        # (e do backoff), então erros em sequência não disparam reconexões paralelas
+                        self._disconnected.set()
             
             # Handler para eventos de autenticação
             @self.sio.on('init', namespace='/trade')
             async def on_init(data):
                 """Evento de inicialização/autenticação."""
                 try:
-                    logger.info(f"📡 Evento init recebido: {data}")
+                    logger.info("📡 Evento init recebido: %s", data)
                     
                     if isinstance(data, dict):
                         auth_status = data.get('authenticated', False)
@@ -146,17 +342,17 @@ class MarketplaceScanner:
                             logger.warning("⚠️ Servidor indica que não está autenticado")
                             self.authenticated = False
                     else:
-                        logger.info(f"📡 Evento init recebido (tipo: {type(data)})")
+                        logger.info("📡 Evento init recebido (tipo: %s)", type(data))
                         
                 except Exception as e:
-                    logger.error(f"❌ Erro ao processar evento init: {e}")
+                    logger.error("❌ Erro ao processar evento init: %s", e)
             
             # Handler para eventos de autenticação
             @self.sio.on('auth', namespace='/trade')
             async def on_auth(data):
                 """Evento de resposta de autenticação."""
                 try:
-                    logger.info(f"📡 Evento auth recebido: {data}")
+                    logger.info("📡 Evento auth recebido: %s", data)
                     
                     if isinstance(data, dict):
                         auth_status = data.get('authenticated', False)
@@ -167,17 +363,35 @@ class MarketplaceScanner:
                             logger.warning("⚠️ Comando auth falhou")
                             self.authenticated = False
                     else:
-                        logger.info(f"📡 Evento auth recebido (tipo: {type(data)})")
+                        logger.info("📡 Evento auth recebido (tipo: %s)", type(data))
                         
                 except Exception as e:
-                    logger.error(f"❌ Erro ao processar evento auth: {e}")
+                    logger.error("❌ Erro ao processar evento auth: %s", e)
             
             logger.info("✅ Handlers de eventos configurados")
             
         except Exception as e:
-            logger.error(f"❌ Erro ao configurar eventos: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("❌ Erro ao configurar eventos: %s", e)
+    
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Retorna a sessão HTTP compartilhada, criando-a se necessário."""
+        if self._http is None or self._http.closed:
+            # Headers e timeout como padrão da sessão - não são remontados a cada requisição.
+            # Keep-alive acima do intervalo de polling da API (30s) para reaproveitar a conexão TLS;
+            # todas as requisições vão para o mesmo host.
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=10,
+                    limit_per_host=4,
+                    ttl_dns_cache=600,
+                    keepalive_timeout=60,
+                    enable_cleanup_closed=True
+                ),
+                headers=self._api_headers,
+                timeout=self._http_timeout,
+                json_serialize=json_module.dumps
+            )
+        return self._http
     
     async def _get_socket_metadata(self) -> bool:
         """Obtém metadata para autenticação do WebSocket."""
@@ -188,35 +402,39 @@ class MarketplaceScanner:
             
             # Endpoint conforme documentação oficial
             url = "https://csgoempire.com/api/v2/metadata/socket"
-            headers = {
-                "Authorization": f"Bearer {self.settings.CSGOEMPIRE_API_KEY}",
-                "Accept": "application/json",
-                "User-Agent": "Mozilla/5.0"
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        js_data = data.get('data') or data
-                        
-                        self.user_id = js_data.get('user', {}).get('id')
-                        self.socket_token = js_data.get('socket_token')
-                        self.socket_signature = js_data.get('socket_signature') or js_data.get('token_signature')
-                        self.user_model = js_data.get('user')
-                        
-                        if all([self.user_id, self.socket_token, self.socket_signature, self.user_model]):
-                            logger.info("✅ Metadata obtida com sucesso")
-                            return True
-                        else:
-                            logger.error("❌ Dados de autenticação incompletos")
-                            return False
+            session = self._get_http_session()
+            async with session.get(url) as response:
+                if response.status == 200:
+                    data = await response.json(loads=json_module.loads)
+                    js_data = data.get('data') or data
+                    
+                    self.user_id = js_data.get('user', {}).get('id')
+                    self.socket_token = js_data.get('socket_token')
+                    self.socket_signature = js_data.get('socket_signature') or js_data.get('token_signature')
+                    self.user_model = js_data.get('user')
+                    
+                    if all([self.user_id, self.socket_token, self.socket_signature, self.user_model]):
+                        # Formato conforme documentação oficial do CSGOEmpire - reutilizado a cada identify
+                        self._identify_payload = {
+                            'uid': self.user_id,
+                            'model': self.user_model,
+                            'authorizationToken': self.socket_token,
+                            'signature': self.socket_signature
+                        }
+                        logger.info("✅ Metadata obtida com sucesso")
+                        return True
                     else:
-                        logger.error(f"❌ Erro ao obter metadata: {response.status}")
+                        logger.error("❌ Dados de autenticação incompletos")
                         return False
-                        
+                else:
+                    logger.error("❌ Erro ao obter metadata: %s", response.status)
+                    return False
+                    
+        except asyncio.TimeoutError:
+            logger.error("⏱️ Timeout ao obter metadata (%ss)", self._http_timeout.total)
+            return False
         except Exception as e:
-            logger.error(f"❌ Erro ao obter metadata: {e}")
+            logger.error("❌ Erro ao obter metadata: %s", e)
             return False
     
     async def _connect_websocket(self) -> bool:
@@ -239,10 +457,10 @@ class MarketplaceScanner:
             # CSGOEmpire usa EIO=3 e o endpoint correto é wss://trade.csgoempire.com/s/
             base_url = "wss://trade.csgoempire.com"
             
-            logger.info(f"🔌 Conectando ao WebSocket CSGOEmpire...")
-            logger.info(f"   - URL base: {base_url}")
-            logger.info(f"   - User ID: {self.user_id}")
-            logger.info(f"   - Token: {self.socket_token[:20]}...")
+            logger.info("🔌 Conectando ao WebSocket CSGOEmpire...")
+            logger.info("   - URL base: %s", base_url)
+            logger.info("   - User ID: %s", self.user_id)
+            logger.info("   - Token: %s...", self.socket_token[:20])
             
             # Conecta usando a documentação oficial do CSGOEmpire
             await self.sio.connect(
@@ -259,11 +477,9 @@ class MarketplaceScanner:
                 namespaces=['/trade']
             )
             
+            # connect() só retorna depois que o namespace /trade confirmou a conexão - não há o que esperar
             logger.info("🔌 WebSocket conectado ao namespace /trade")
             
-            # Aguarda estabilizar
-            await asyncio.sleep(2)
-            
             if not self.sio.connected:
                 logger.error("❌ WebSocket desconectado após conexão")
                 return False
@@ -273,7 +489,7 @@ class MarketplaceScanner:
             return True
                 
         except Exception as e:
-            logger.error(f"❌ Erro ao conectar WebSocket: {e}")
+            logger.error("❌ Erro ao conectar WebSocket: %s", e)
             return False
     
     async def _configure_websocket(self):
@@ -281,44 +497,37 @@ class MarketplaceScanner:
         try:
             logger.info("🔧 Configurando WebSocket após conexão...")
             
-            # Aguarda estabilizar
-            await asyncio.sleep(1)
-            
             # Emite identify conforme documentação oficial do CSGOEmpire
             logger.info("🆔 Emitindo identify para autenticação...")
-            logger.info(f"   - User ID: {self.user_id}")
-            logger.info(f"   - Token: {self.socket_token[:20]}...")
-            logger.info(f"   - Signature: {self.socket_signature[:20]}...")
-            
-            # Formato conforme documentação oficial do CSGOEmpire
-            identify_data = {
-                'uid': self.user_id,
-                'model': self.user_model,
-                'authorizationToken': self.socket_token,
-                'signature': self.socket_signature
-            }
+            logger.info("   - User ID: %s", self.user_id)
+            logger.info("   - Token: %s...", self.socket_token[:20])
+            logger.info("   - Signature: %s...", self.socket_signature[:20])
             
             logger.info("🆔 Enviando comando identify...")
-            await self.sio.emit('identify', identify_data, namespace='/trade')
+            await self.sio.emit('identify', self._identify_payload, namespace='/trade')
             
-            # Aguarda autenticação
+            # Aguarda a confirmação (init/auth) antes dos filtros - acorda assim que chegar,
+            # limitado aos mesmos 3s da espera fixa anterior
             logger.info("⏳ Aguardando autenticação...")
-            await asyncio.sleep(3)
+            try:
+                await asyncio.wait_for(self._auth_event.wait(), timeout=3)
+            except asyncio.TimeoutError:
+                logger.warning("⚠️ Autenticação ainda não confirmada - enviando filtros mesmo assim")
             
             # Configura filtros conforme documentação oficial do CSGOEmpire
             logger.info("📤 Configurando filtros de preço...")
             
-            # Converte preços USD para centavos (formato esperado pela API)
-            price_min_centavos = int(self.settings.MIN_PRICE / self.settings.COIN_TO_USD_FACTOR * 100)
-            price_max_centavos = int(self.settings.MAX_PRICE / self.settings.COIN_TO_USD_FACTOR * 100)
-            
-            filters_data = {
-                'price_max': price_max_centavos  # CSGOEmpire usa centavos
-            }
+            logger.info("📤 Filtro de preço: máximo %s centavos ($%.2f)", self._filters_payload['price_max'], self._max_price)
             
-            logger.info(f"📤 Filtro de preço: máximo {price_max_centavos} centavos (${self.settings.MAX_PRICE:.2f})")
-            await self.sio.emit('filters', filters_data, namespace='/trade')
+            # Payloads pré-montados. Restringe os eventos de trade ao que o scanner trata -
+            # o servidor deixa de enviar os demais (ex.: updated_item, deleted_item, auction_update).
+            # Filtros e eventos permitidos são independentes: envia os dois juntos.
+            await asyncio.gather(
+                self.sio.emit('filters', self._filters_payload, namespace='/trade'),
+                self.sio.emit('allowedEvents', _ALLOWED_EVENTS_PAYLOAD, namespace='/trade')
+            )
             logger.info("📤 Filtros configurados com sucesso")
+            logger.info("📤 Eventos permitidos: new_item")
             
             # NÃO marca como autenticado aqui - aguarda confirmação do servidor
             logger.info("⏳ Aguardando confirmação de autenticação do servidor...")
@@ -326,7 +535,7 @@ class MarketplaceScanner:
             
             # Log de configuração
             logger.info("🔍 Configuração do WebSocket concluída:")
-            logger.info("   - Filtros de preço: $%.2f - $%.2f" % (self.settings.MIN_PRICE, self.settings.MAX_PRICE))
+            logger.info("   - Filtros de preço: $%.2f - $%.2f", self._min_price, self._max_price)
             logger.info("   - Evento único: new_item")
             logger.info("   - Aguardando confirmação de autenticação...")
             
@@ -338,93 +547,113 @@ class MarketplaceScanner:
             logger.info("   - Status: 🔄 AGUARDANDO AUTENTICAÇÃO DO SERVIDOR")
             
         except Exception as e:
-            logger.error(f"❌ Erro ao configurar WebSocket: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
-    
-    async def _reconnect_websocket(self):
-        """Reconecta ao WebSocket após falha de autenticação."""
-        try:
-            logger.info("🔄 Reconectando WebSocket após falha de autenticação...")
-            
-            # Desconecta atual
-            if self.sio.connected:
-                await self.sio.disconnect()
-                logger.info("🔌 WebSocket desconectado para reconexão")
-            
-            # Aguarda um pouco
-            await asyncio.sleep(5)
-            
-            # Reconecta
-            if await self._connect_websocket():
-                logger.info("✅ Reconexão bem-sucedida")
-                # Reconfigura
-                await self._configure_websocket()
-            else:
-                logger.error("❌ Falha na reconexão")
-                
-        except Exception as e:
-            logger.error(f"❌ Erro durante reconexão: {e}")
+            logger.exception("❌ Erro ao configurar WebSocket: %s", e)
     
     async def _wait_for_authentication(self, timeout_seconds: int = 30) -> bool:
         """Aguarda autenticação ser confirmada pelo servidor."""
         try:
-            logger.info(f"⏳ Aguardando autenticação (timeout: {timeout_seconds}s)...")
+            logger.info("⏳ Aguardando autenticação (timeout: %ss)...", timeout_seconds)
             
-            start_time = time.time()
-            while time.time() - start_time < timeout_seconds:
-                if self.authenticated:
-                    logger.info("✅ Autenticação confirmada pelo servidor!")
-                    return True
-                
-                await asyncio.sleep(1)
+            # Acorda assim que init/auth confirmar, sem polling
+            try:
+                await asyncio.wait_for(self._auth_event.wait(), timeout=timeout_seconds)
+            except asyncio.TimeoutError:
+                logger.warning("⚠️ Timeout de autenticação (%ss) - não autenticado", timeout_seconds)
+                return False
             
-            logger.warning(f"⚠️ Timeout de autenticação ({timeout_seconds}s) - não autenticado")
-            return False
+            logger.info("✅ Autenticação confirmada pelo servidor!")
+            return True
             
         except Exception as e:
-            logger.error(f"❌ Erro ao aguardar autenticação: {e}")
+            logger.error("❌ Erro ao aguardar autenticação: %s", e)
             return False
     
-    def _is_item_already_processed(self, item_id: str) -> bool:
+    def _is_item_already_processed(self, item_id: int) -> bool:
         """Verifica se o item já foi processado para evitar duplicatas."""
-        return item_id in self.processed_items
+        processed_at = self.processed_items.get(item_id)
+        return processed_at is not None and time.monotonic() - processed_at <= self.processed_items_ttl
+    
+    def _mark_item_as_processed(self, item_id: int) -> None:
+        """Marca um item como processado, descartando o mais antigo quando o cache está cheio (O(1))."""
+        now = time.monotonic()
+        order = self._processed_order
+        if len(order) == order.maxlen:
+            # O append abaixo descarta order[0] - remove do dict só se não foi remarcado depois
+            oldest_id, oldest_ts = order[0]
+            if self.processed_items.get(oldest_id) == oldest_ts:
+                del self.processed_items[oldest_id]
+        order.append((item_id, now))
+        self.processed_items[item_id] = now
     
-    def _mark_item_as_processed(self, item_id: str) -> None:
-        """Marca um item como processado e limpa itens antigos se necessário."""
-        self.processed_items.add(item_id)
+    def _claim_item(self, item_id: int) -> bool:
+        """Reserva o item para processamento; False se já foi processado dentro do TTL."""
+        if self._is_item_already_processed(item_id):
+            logger.debug("🔄 Item já processado anteriormente: %s - ignorando duplicata", item_id)
+            return False
         
-        # Limpa itens antigos se exceder o limite
-        if len(self.processed_items) > self.max_processed_items:
-            # Remove os itens mais antigos (mantém apenas os últimos 1000)
-            items_to_remove = len(self.processed_items) - self.max_processed_items
-            items_list = list(self.processed_items)
-            for i in range(items_to_remove):
-                self.processed_items.remove(items_list[i])
-            logger.debug(f"🧹 Limpeza de cache: {items_to_remove} itens antigos removidos")
+        # Marca antes de qualquer await - vale também para itens rejeitados ou com erro,
+        # evitando loops infinitos
+        self._mark_item_as_processed(item_id)
+        return True
     
-    async def _process_item(self, item: Dict, event_type: str) -> None:
-        """Processa um item recebido."""
+    def _enqueue_item(self, item_id: int, market_name: Optional[str], purchase_price: Optional[int], event_type: str) -> None:
+        """Coloca um item na fila de processamento, descartando o mais antigo se estiver cheia."""
+        entry = (item_id, market_name, purchase_price, event_type)
+        try:
+            self._work_q.put_nowait(entry)
+        except asyncio.QueueFull:
+            # Itens recentes valem mais para oportunidades - descarta o mais antigo
+            dropped_id = self._work_q.get_nowait()[0]
+            self._work_q.task_done()
+            self._work_q.put_nowait(entry)
+            logger.warning("⚠️ Fila de processamento cheia - item %s descartado", dropped_id)
+    
+    def _start_workers(self) -> None:
+        """Inicia os workers de processamento (uma única vez)."""
+        if self._workers:
+            return
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self._worker_count)]
+        self._workers.append(asyncio.create_task(self._liquidity_loader.run()))
+        self._workers.append(asyncio.create_task(self._buff163_loader.run()))
+        self._workers.append(asyncio.create_task(self._discord_worker()))
+        logger.info("👷 %s workers de processamento iniciados", self._worker_count)
+    
+    async def _worker(self) -> None:
+        """Consome a fila de itens: enriquecimento, filtros e postagem no Discord."""
+        while True:
+            item_id, market_name, purchase_price, event_type = await self._work_q.get()
+            try:
+                await self._process_item(item_id, market_name, purchase_price, event_type)
+            finally:
+                self._work_q.task_done()
+    
+    def _enqueue_opportunity(self, item: ItemData) -> None:
+        """Coloca uma oportunidade na fila de postagem do Discord."""
+        try:
+            self._discord_q.put_nowait(item)
+        except asyncio.QueueFull:
+            logger.warning("⚠️ Fila do Discord cheia - oportunidade %s descartada", item.name)
+    
+    async def _discord_worker(self) -> None:
+        """Posta as oportunidades da fila no Discord, em lotes concorrentes."""
+        queue = self._discord_q
+        post = self.discord_poster.post_opportunity
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self._discord_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await asyncio.gather(*(post(item) for item in batch), return_exceptions=True)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    
+    async def _process_item(self, item_id: int, market_name: Optional[str], purchase_price: Optional[int], event_type: str) -> None:
+        """Processa um item recebido (já aprovado pelo filtro de preço e reservado por _claim_item)."""
         try:
-            # Verifica se o item já foi processado
-            item_id = str(item.get('id', ''))
-            if not item_id:
-                logger.warning("⚠️ Item sem ID, ignorando")
-                return
-            
-            if self._is_item_already_processed(item_id):
-                logger.info(f"🔄 Item já processado anteriormente: {item_id} - ignorando duplicata")
-                return
-            
-            # Filtro básico de preço (ultra-rápido)
-            if not self._check_basic_price_filter(item):
-                self._mark_item_as_processed(item_id)  # Marca como processado mesmo que rejeitado
-                return
-            
             # Extrai dados básicos
-            extracted_item = self._extract_item_data(item)
-            if not extracted_item:
-                self._mark_item_as_processed(item_id)
+            extracted_item = self._extract_item_data(item_id, market_name, purchase_price)
+            if extracted_item is None:
                 return
             
             # Enriquece com dados da database
@@ -432,189 +661,159 @@ class MarketplaceScanner:
             
             # Aplica filtros de oportunidade
             if await self._apply_opportunity_filters(extracted_item):
-                logger.info(f"🎯 OPORTUNIDADE ENCONTRADA: {extracted_item.get('name')}")
-                await self.discord_poster.post_opportunity(extracted_item)
+                logger.info("🎯 OPORTUNIDADE ENCONTRADA: %s", extracted_item.name)
+                self._enqueue_opportunity(extracted_item)
             
-            # Marca como processado após todo o processamento
-            self._mark_item_as_processed(item_id)
-            logger.info(f"✅ Item processado com sucesso: {item_id} (Total processados: {len(self.processed_items)})")
+            logger.debug("✅ Item processado com sucesso: %s (Total processados: %s)", item_id, len(self.processed_items))
                 
         except Exception as e:
-            logger.error(f"❌ Erro ao processar item: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            
-            # Marca como processado mesmo em caso de erro para evitar loops infinitos
-            if item_id:
-                self._mark_item_as_processed(item_id)
+            logger.exception("❌ Erro ao processar item: %s", e)
     
     def _check_basic_price_filter(self, item: Dict) -> bool:
-        """Filtro básico de preço (ultra-rápido)."""
-        try:
+        """Filtro básico de preço (ultra-rápido): comparação inteira nos limites em centavos."""
+        if _fast_price_ok(item, self._min_centavos, self._max_centavos):
+            return True
+        
+        # Detalhe da rejeição só quando DEBUG está ativo - o caminho comum não formata nada
+        if logger.isEnabledFor(logging.DEBUG):
             purchase_price_centavos = item.get('purchase_price')
             if purchase_price_centavos is None:
-                return False
-            
-            # Converte centavos para USD
-            price_usd = (purchase_price_centavos / 100) * self.settings.COIN_TO_USD_FACTOR
-            
-            if price_usd < self.settings.MIN_PRICE:
-                logger.debug(f"🚫 Item {item.get('market_name', 'Unknown')} REJEITADO: ${price_usd:.2f} < ${self.settings.MIN_PRICE:.2f}")
-                return False
-            
-            if price_usd > self.settings.MAX_PRICE:
-                logger.debug(f"🚫 Item {item.get('market_name', 'Unknown')} REJEITADO: ${price_usd:.2f} > ${self.settings.MAX_PRICE:.2f}")
-                return False
-            
-            logger.debug(f"✅ Item {item.get('market_name', 'Unknown')} ACEITO no filtro de preço: ${price_usd:.2f}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"❌ Erro no filtro de preço: {e}")
-            return False
+                logger.debug("🚫 Item %s REJEITADO: sem preço", item.get('market_name', 'Unknown'))
+            else:
+                logger.debug("🚫 Item %s REJEITADO: $%.2f fora de $%.2f - $%.2f", item.get('market_name', 'Unknown'),
+                             purchase_price_centavos * self._cents_to_usd, self._min_price, self._max_price)
+        return False
     
-    def _extract_item_data(self, data: Dict) -> Optional[Dict]:
-        """Extrai dados relevantes do item."""
+    def _extract_item_data(self, item_id: int, market_name: Optional[str], purchase_price: Optional[int]) -> Optional[ItemData]:
+        """Monta o ItemData a partir dos campos já lidos do payload."""
         try:
-            item_id = data.get('id')
-            market_name = data.get('market_name')
-            purchase_price = data.get('purchase_price')
-            
-            if not all([item_id, market_name, purchase_price]):
+            # Curto-circuito direto, sem montar uma lista temporária por item
+            if not (item_id and market_name and purchase_price):
                 return None
             
             # Parse do nome do item
-            base_name, is_stattrak, is_souvenir, condition = self._parse_market_hash_name(market_name)
+            base_name, is_stattrak, is_souvenir, condition = _parse_market_hash_name(market_name)
             
             # Converte preço de centavos para USD
-            price_usd = (purchase_price / 100) * self.settings.COIN_TO_USD_FACTOR
-            
-            logger.info(f"💰 Item: {market_name}")
-            logger.info(f"   - Base: {base_name}")
-            logger.info(f"   - StatTrak: {is_stattrak}")
-            logger.info(f"   - Souvenir: {is_souvenir}")
-            logger.info(f"   - Condição: {condition}")
-            logger.info(f"   - Preço CSGOEmpire: {purchase_price} centavos = ${price_usd:.2f}")
-            
-            return {
-                'id': item_id,
-                'name': market_name,
-                'base_name': base_name,
-                'is_stattrak': is_stattrak,
-                'is_souvenir': is_souvenir,
-                'condition': condition,
-                'price': price_usd,
-                'price_centavos': purchase_price,
-                'marketplace': 'csgoempire',
-                'detected_at': datetime.now().isoformat()
-            }
+            price_usd = purchase_price * self._cents_to_usd
             
-        except Exception as e:
-            logger.error(f"❌ Erro ao extrair dados do item: {e}")
-            return None
-    
-    def _parse_market_hash_name(self, name: str) -> tuple:
-        """Parse do nome do item."""
-        try:
-            if not name:
-                return "", False, False, None
-            
-            s = name.strip()
-            stattrak = ("StatTrak™" in s) or ("StatTrak" in s)
-            souvenir = ("Souvenir" in s)
-            condition = None
-            
-            # Lista de condições
-            conditions = [
-                "Factory New", "Minimal Wear", "Field-Tested", 
-                "Well-Worn", "Battle-Scarred"
-            ]
-            
-            # Remove a condição do final
-            for c in conditions:
-                suffix = f"({c})"
-                if s.endswith(suffix):
-                    condition = c
-                    s = s[:-len(suffix)].strip()
-                    break
-            
-            # Remove flags do início
-            base = (
-                s.replace("StatTrak™ ", "")
-                 .replace("StatTrak ", "")
-                 .replace("Souvenir ", "")
-                 .strip()
+            # Um único registro por item (antes eram seis chamadas de log) - detalhe só em DEBUG
+            logger.debug(
+                "💰 Item: %s | base=%s stattrak=%s souvenir=%s condição=%s | %s centavos = $%.2f",
+                market_name, base_name, is_stattrak, is_souvenir, condition, purchase_price, price_usd
             )
             
-            return base, stattrak, souvenir, condition
+            return ItemData(
+                id=item_id,
+                name=market_name,
+                base_name=base_name,
+                is_stattrak=is_stattrak,
+                is_souvenir=is_souvenir,
+                condition=condition,
+                price=price_usd,
+                price_centavos=purchase_price,
+                marketplace='csgoempire',
+                detected_at=time.time()
+            )
             
         except Exception as e:
-            logger.error(f"❌ Erro ao fazer parse do nome: {e}")
-            return name, False, False, None
+            logger.error("❌ Erro ao extrair dados do item: %s", e)
+            return None
     
-    async def _enrich_item_data(self, item: Dict) -> None:
+    async def _enrich_item_data(self, item: ItemData) -> None:
         """Enriquece o item com dados da database."""
         try:
-            base_name = item.get('base_name')
-            is_stattrak = item.get('is_stattrak', False)
-            is_souvenir = item.get('is_souvenir', False)
-            condition = item.get('condition')
+            base_name = item.base_name
+            is_stattrak = item.is_stattrak
+            is_souvenir = item.is_souvenir
+            condition = item.condition
             
             if not base_name:
                 return
             
-            logger.info(f"🔍 Enriquecendo item: {base_name}")
+            cache_key = (base_name, is_stattrak, is_souvenir, condition)
+            if self._enrich_misses.get(cache_key):
+                logger.debug("⏭️ Item sem dados na database (cache negativo): %s", base_name)
+                return
+            
+            logger.debug("🔍 Enriquecendo item: %s", base_name)
             
-            # Busca preço Buff163
-            price_buff163 = await self.supabase.get_buff163_price_advanced(
-                base_name, is_stattrak, is_souvenir, condition
+            # Buff163 e liquidez são consultas independentes - roda as duas ao mesmo tempo
+            price_buff163, liquidity_score = await asyncio.gather(
+                self._get_buff163_price(cache_key),
+                self._get_liquidity_score(cache_key),
+                return_exceptions=True
             )
             
+            # Uma falha em uma consulta não descarta o resultado da outra
+            lookup_failed = False
+            if isinstance(price_buff163, Exception):
+                logger.error("❌ Erro ao buscar preço Buff163: %s", price_buff163)
+                price_buff163 = None
+                lookup_failed = True
+            if isinstance(liquidity_score, Exception):
+                logger.error("❌ Erro ao buscar score de liquidez: %s", liquidity_score)
+                liquidity_score = None
+                lookup_failed = True
+            
+            item.price_buff163 = price_buff163
+            item.liquidity_score = liquidity_score
+            
+            # Resultado da busca por item: detalhe de depuração, não aviso - faltar dado é o caso comum
             if price_buff163 is not None:
-                item['price_buff163'] = price_buff163
-                logger.info(f"💰 Preço Buff163 encontrado: ${price_buff163:.2f}")
+                logger.debug("💰 Preço Buff163 encontrado: $%.2f", price_buff163)
             else:
-                item['price_buff163'] = None
-                logger.warning(f"⚠️ Preço Buff163 não encontrado para: {base_name}")
-            
-            # Busca score de liquidez
-            liquidity_score = await self.supabase.get_liquidity_score_advanced(
-                base_name, is_stattrak, is_souvenir, condition
-            )
+                logger.debug("⚠️ Preço Buff163 não encontrado para: %s", base_name)
             
             if liquidity_score is not None:
-                item['liquidity_score'] = liquidity_score
-                logger.info(f"💧 Score de liquidez encontrado: {liquidity_score:.1f}")
+                logger.debug("💧 Score de liquidez encontrado: %.1f", liquidity_score)
             else:
-                item['liquidity_score'] = None
-                logger.warning(f"⚠️ Score de liquidez não encontrado para: {base_name}")
+                logger.debug("⚠️ Score de liquidez não encontrado para: %s", base_name)
+            
+            # Sem qualquer um dos dois o item é rejeitado pelos filtros. Só entra no cache negativo
+            # quando as duas consultas foram feitas com sucesso - erros chegam aqui como exceção
+            if not lookup_failed and (price_buff163 is None or liquidity_score is None):
+                self._enrich_misses.set(cache_key, True)
                 
         except Exception as e:
-            logger.error(f"❌ Erro ao enriquecer item: {e}")
+            logger.error("❌ Erro ao enriquecer item: %s", e)
+    
+    async def _get_buff163_price(self, key: tuple) -> Optional[float]:
+        """Preço Buff163 do item: cache primeiro, depois a consulta em lote."""
+        price_buff163 = self._buff163_cache.get(key)
+        if price_buff163 is None:
+            price_buff163 = await self._buff163_loader.load(key)
+            if price_buff163 is not None:
+                self._buff163_cache.set(key, price_buff163)
+        return price_buff163
+    
+    async def _get_liquidity_score(self, key: tuple) -> Optional[float]:
+        """Score de liquidez do item: cache primeiro, depois a consulta em lote."""
+        liquidity_score = self._liquidity_cache.get(key)
+        if liquidity_score is None:
+            liquidity_score = await self._liquidity_loader.load(key)
+            if liquidity_score is not None:
+                self._liquidity_cache.set(key, liquidity_score)
+        return liquidity_score
     
-    async def _apply_opportunity_filters(self, item: Dict) -> bool:
+    async def _apply_opportunity_filters(self, item: ItemData) -> bool:
         """Aplica filtros de oportunidade."""
         try:
-            from filters.profit_filter import ProfitFilter
-            from filters.liquidity_filter import LiquidityFilter
-            
             # Filtro de lucro
-            profit_filter = ProfitFilter(self.settings.MIN_PROFIT_PERCENTAGE)
-            if not await profit_filter.check(item):
-                logger.debug(f"❌ Item {item.get('name')} REJEITADO pelo filtro de lucro")
+            if not await self._profit_filter.check(item):
+                logger.debug("❌ Item %s REJEITADO pelo filtro de lucro", item.name)
                 return False
             
             # Filtro de liquidez
-            liquidity_filter = LiquidityFilter(self.settings.MIN_LIQUIDITY_SCORE)
-            if not await liquidity_filter.check(item):
-                logger.debug(f"❌ Item {item.get('name')} REJEITADO pelo filtro de liquidez")
+            if not await self._liquidity_filter.check(item):
+                logger.debug("❌ Item %s REJEITADO pelo filtro de liquidez", item.name)
                 return False
             
-            logger.info(f"✅ Item {item.get('name')} ACEITO em todos os filtros")
+            logger.info("✅ Item %s ACEITO em todos os filtros", item.name)
             return True
             
         except Exception as e:
-            logger.error(f"❌ Erro ao aplicar filtros: {e}")
+            logger.error("❌ Erro ao aplicar filtros: %s", e)
             return False
     
     async def _get_items_via_api(self) -> List[Dict]:
@@ -624,30 +823,28 @@ class MarketplaceScanner:
             
             # Endpoint para buscar itens disponíveis
             url = "https://csgoempire.com/api/v2/trading/items"
-            headers = {
-                "Authorization": f"Bearer {self.settings.CSGOEMPIRE_API_KEY}",
-                "Accept": "application/json",
-                "User-Agent": "Mozilla/5.0"
-            }
-            
             params = {
                 "limit": 100,  # Busca até 100 itens
                 "offset": 0
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        items = data.get('data', [])
-                        logger.info(f"✅ API retornou {len(items)} itens")
-                        return items
-                    else:
-                        logger.error(f"❌ Erro na API: {response.status}")
-                        return []
+            # Sessão compartilhada: headers, timeout e a conexão keep-alive vêm dela
+            session = self._get_http_session()
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json(loads=json_module.loads)
+                    items = data.get('data', [])
+                    logger.info("✅ API retornou %s itens", len(items))
+                    return items
+                else:
+                    logger.error("❌ Erro na API: %s", response.status)
+                    return []
                         
+        except asyncio.TimeoutError:
+            logger.error("⏱️ Timeout ao buscar itens via API (%ss)", self._http_timeout.total)
+            return []
         except Exception as e:
-            logger.error(f"❌ Erro ao buscar itens via API: {e}")
+            logger.error("❌ Erro ao buscar itens via API: %s", e)
             return []
     
     async def _scan_items_via_api(self):
@@ -661,14 +858,18 @@ class MarketplaceScanner:
                     items = await self._get_items_via_api()
                     
                     if items:
-                        logger.info(f"📋 Processando {len(items)} itens...")
+                        logger.info("📋 Processando %s itens...", len(items))
                         
-                        for item in items:
+                        price_ok = self._check_basic_price_filter
+                        for item in [item for item in items if price_ok(item)]:
+                            item_id = item.get('id')
+                            if item_id is None or not self._claim_item(item_id):
+                                continue
                             try:
                                 # Processa cada item
-                                await self._process_item(item, 'api_scan')
+                                await self._process_item(item_id, item.get('market_name'), item.get('purchase_price'), 'api_scan')
                             except Exception as e:
-                                logger.error(f"❌ Erro ao processar item: {e}")
+                                logger.error("❌ Erro ao processar item: %s", e)
                                 continue
                     else:
                         logger.info("📋 Nenhum item encontrado via API")
@@ -678,19 +879,22 @@ class MarketplaceScanner:
                     await asyncio.sleep(30)
                     
                 except Exception as e:
-                    logger.error(f"❌ Erro no loop de scanner API: {e}")
+                    logger.error("❌ Erro no loop de scanner API: %s", e)
                     await asyncio.sleep(30)
                     
         except asyncio.CancelledError:
             logger.info("🛑 Scanner API cancelado")
         except Exception as e:
-            logger.error(f"❌ Erro fatal no scanner API: {e}")
+            logger.error("❌ Erro fatal no scanner API: %s", e)
     
     async def start(self):
         """Inicia o scanner."""
         try:
             logger.info("🚀 Iniciando scanner de marketplace...")
             
+            # Workers precisam estar rodando antes de o WebSocket entregar itens
+            self._start_workers()
+            
             # Obtém metadata para WebSocket
             if not await self._get_socket_metadata():
                 logger.error("❌ Falha ao obter metadata")
@@ -702,12 +906,15 @@ class MarketplaceScanner:
                 return False
             
             # Conecta ao WebSocket
+            was_connected = self.sio.connected
             if not await self._connect_websocket():
                 logger.error("❌ Falha ao conectar ao WebSocket")
                 return False
             
-            # Configura o WebSocket após conexão
-            await self._configure_websocket()
+            # Uma conexão nova é configurada pelo handler 'connect'; só uma conexão já existente
+            # (ainda não autenticada) precisa de um novo identify aqui
+            if was_connected and not self.authenticated:
+                await self._configure_websocket()
             
             # Aguarda autenticação ser confirmada pelo servidor
             if not await self._wait_for_authentication(timeout_seconds=30):
@@ -718,7 +925,7 @@ class MarketplaceScanner:
             return True
                 
         except Exception as e:
-            logger.error(f"❌ Erro ao iniciar scanner: {e}")
+            logger.error("❌ Erro ao iniciar scanner: %s", e)
             return False
     
     async def disconnect(self):
@@ -731,21 +938,36 @@ class MarketplaceScanner:
             self.is_connected = False
             self.authenticated = False
             
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            self._workers = []
+            
+            if self._http is not None and not self._http.closed:
+                await self._http.close()
+            await self.discord_poster.close()
+            
         except Exception as e:
-            logger.error(f"❌ Erro ao desconectar: {e}")
+            logger.error("❌ Erro ao desconectar: %s", e)
     
     async def run_forever(self):
         """Executa o scanner indefinidamente."""
         try:
             logger.info("🚀 Iniciando scanner de marketplace...")
             
+            # Espera entre tentativas de reconexão: exponencial com jitter, volta a 1s após conectar.
+            # Local ao run_forever - é o único lugar que reconecta
+            backoff = 1.0
             while True:
                 try:
                     # Tenta conectar
                     if await self.start():
                         logger.info("✅ Scanner conectado e autenticado, aguardando oportunidades...")
+                        backoff = 1.0
                         
-                        # Loop de monitoramento do WebSocket
+                        # Loop de monitoramento do WebSocket (cadência fixa, independente da duração da checagem)
+                        loop = asyncio.get_running_loop()
+                        next_check = loop.time()
                         while True:
                             if not self.sio.connected:
                                 logger.warning("⚠️ WebSocket desconectado, tentando reconectar...")
@@ -762,10 +984,24 @@ class MarketplaceScanner:
                                     logger.warning("⚠️ Reautenticação falhou, reconectando...")
                                     break
                             
-                            await asyncio.sleep(30)
+                            next_check += self.health_check_interval
+                            now = loop.time()
+                            if next_check < now:
+                                next_check = now + self.health_check_interval
+                            
+                            # Aguarda o próximo ciclo ou uma desconexão, o que vier primeiro
+                            try:
+                                await asyncio.wait_for(self._disconnected.wait(), timeout=next_check - now)
+                                self._disconnected.clear()
+                            except asyncio.TimeoutError:
+                                pass
                         
-                        # Aguarda antes de reconectar
-                        await asyncio.sleep(10)
+                        # Derruba a conexão atual (se ainda aberta) para que start() reconecte do zero,
+                        # com metadata nova, e aguarda antes de reconectar
+                        if self.sio.connected:
+                            await self.sio.disconnect()
+                            logger.info("🔌 WebSocket desconectado para reconexão")
+                        backoff = await _sleep_backoff(backoff)
                         
                     else:
                         # Falha na conexão
@@ -774,17 +1010,17 @@ class MarketplaceScanner:
                             await asyncio.sleep(300)
                             self.reconnect_attempts = 0
                         else:
-                            logger.warning(f"⚠️ Tentativa {self.reconnect_attempts + 1}/{self.settings.WEBSOCKET_MAX_RECONNECT_ATTEMPTS} falhou")
-                            await asyncio.sleep(30)
+                            logger.warning("⚠️ Tentativa %s/%s falhou", self.reconnect_attempts + 1, self.settings.WEBSOCKET_MAX_RECONNECT_ATTEMPTS)
+                            backoff = await _sleep_backoff(backoff)
                             self.reconnect_attempts += 1
                             
                 except Exception as e:
-                    logger.error(f"❌ Erro no loop principal: {e}")
-                    await asyncio.sleep(30)
+                    logger.error("❌ Erro no loop principal: %s", e)
+                    backoff = await _sleep_backoff(backoff)
                     
         except asyncio.CancelledError:
             logger.info("🛑 Scanner cancelado")
         except Exception as e:
-            logger.error(f"❌ Erro fatal no scanner: {e}")
+            logger.error("❌ Erro fatal no scanner: %s", e)
         finally:
             await self.disconnect()
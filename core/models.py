@@ -0,0 +1,26 @@
+"""
+Modelos de dados do Opportunity Bot.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class ItemData:
+    """Item do marketplace extraído do WebSocket e enriquecido com dados da database."""
+    
+    id: int
+    name: str
+    base_name: str
+    is_stattrak: bool
+    is_souvenir: bool
+    condition: Optional[str]
+    price: float  # USD
+    price_centavos: int
+    marketplace: str = 'csgoempire'
+    detected_at: float = 0.0  # time.time() da detecção - formatado só na postagem
+    
+    # Preenchidos pelo enriquecimento (None quando não encontrados)
+    price_buff163: Optional[float] = None
+    liquidity_score: Optional[float] = None
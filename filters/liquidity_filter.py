@@ -3,8 +3,7 @@ Filtro de liquidez para o Opportunity Bot.
 """
 
 import logging
-from typing import Dict, Optional
-from utils.supabase_client import SupabaseClient
+from core.models import ItemData
 
 logger = logging.getLogger(__name__)
 
@@ -13,32 +12,31 @@ class LiquidityFilter:
     
     def __init__(self, min_liquidity_score: float = 70.0):
         self.min_liquidity_score = min_liquidity_score
-        self.supabase = SupabaseClient()
     
-    async def check(self, item: Dict) -> bool:
+    async def check(self, item: ItemData) -> bool:
         """Verifica se um item tem boa liquidez."""
         try:
             # Usa o score de liquidez já obtido pelo marketplace_scanner
-            liquidity_score = item.get('liquidity_score')
+            liquidity_score = item.liquidity_score
     
             if liquidity_score is None:
                 # Se não conseguir obter liquidez, REJEITA o item
-                logger.debug(f"Item {item.get('name')} REJEITADO - liquidez não disponível")
+                logger.debug("Item %s REJEITADO - liquidez não disponível", item.name)
                 return False
     
             result = liquidity_score >= self.min_liquidity_score
     
             if result:
-                logger.info(f"✅ Item {item.get('name')} ACEITO - liquidez {liquidity_score:.1f} >= {self.min_liquidity_score}")
+                logger.info("✅ Item %s ACEITO - liquidez %.1f >= %s", item.name, liquidity_score, self.min_liquidity_score)
             else:
-                logger.info(f"❌ Item {item.get('name')} REJEITADO - liquidez {liquidity_score:.1f} < {self.min_liquidity_score}")
+                logger.info("❌ Item %s REJEITADO - liquidez %.1f < %s", item.name, liquidity_score, self.min_liquidity_score)
     
-            logger.debug(f"Liquidez: {liquidity_score:.1f} >= {self.min_liquidity_score} = {result} para {item.get('name')}")
+            logger.debug("Liquidez: %.1f >= %s = %s para %s", liquidity_score, self.min_liquidity_score, result, item.name)
     
             return result
     
         except Exception as e:
-            logger.error(f"Erro ao verificar filtro de liquidez: {e}")
+            logger.error("Erro ao verificar filtro de liquidez: %s", e)
             return False
     
     def get_min_liquidity_score(self) -> float:
@@ -48,4 +46,4 @@ class LiquidityFilter:
     def set_min_liquidity_score(self, score: float):
         """Define o score mínimo de liquidez."""
         self.min_liquidity_score = max(0.0, min(100.0, score))
-        logger.info(f"Score mínimo de liquidez atualizado para {self.min_liquidity_score}")
+        logger.info("Score mínimo de liquidez atualizado para %s", self.min_liquidity_score)
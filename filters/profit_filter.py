@@ -3,8 +3,8 @@ Filtro de lucro para o Opportunity Bot.
 """
 
 import logging
-from typing import Dict, Optional
-from utils.supabase_client import SupabaseClient
+from typing import Optional
+from core.models import ItemData
 
 logger = logging.getLogger(__name__)
 
@@ -13,55 +13,54 @@ class ProfitFilter:
     
     def __init__(self, min_profit_percentage: float = 5.0, coin_to_usd_factor: float = 0.614):
         self.min_profit_percentage = min_profit_percentage
-        self.supabase = SupabaseClient()
         # Fator de conversão de coin para dólar
         self.coin_to_usd_factor = coin_to_usd_factor
     
-    async def check(self, item: Dict) -> bool:
+    async def check(self, item: ItemData) -> bool:
         """Verifica se um item tem potencial de lucro."""
         try:
             profit_percentage = await self.calculate_profit_potential(item)
             
             if profit_percentage is None:
                 # Se não conseguir calcular lucro, REJEITA o item
-                logger.debug(f"Item {item.get('name')} REJEITADO - lucro não pode ser calculado")
+                logger.debug("Item %s REJEITADO - lucro não pode ser calculado", item.name)
                 return False
             
             result = profit_percentage >= self.min_profit_percentage
             
             if result:
-                logger.info(f"✅ Item {item.get('name')} ACEITO - lucro {profit_percentage:.2f}% >= {self.min_profit_percentage}%")
+                logger.info("✅ Item %s ACEITO - lucro %.2f%% >= %s%%", item.name, profit_percentage, self.min_profit_percentage)
             else:
-                logger.info(f"❌ Item {item.get('name')} REJEITADO - lucro {profit_percentage:.2f}% < {self.min_profit_percentage}%")
+                logger.info("❌ Item %s REJEITADO - lucro %.2f%% < %s%%", item.name, profit_percentage, self.min_profit_percentage)
             
-            logger.debug(f"Lucro: {profit_percentage:.2f}% >= {self.min_profit_percentage}% = {result} para {item.get('name')}")
+            logger.debug("Lucro: %.2f%% >= %s%% = %s para %s", profit_percentage, self.min_profit_percentage, result, item.name)
             
             return result
             
         except Exception as e:
-            logger.error(f"Erro ao verificar filtro de lucro: {e}")
+            logger.error("Erro ao verificar filtro de lucro: %s", e)
             return False
     
-    async def calculate_profit_potential(self, item: Dict) -> Optional[float]:
+    async def calculate_profit_potential(self, item: ItemData) -> Optional[float]:
         """
         Calcula o potencial de lucro comparando preço CSGOEmpire vs Buff163.
         
         Args:
-            item: Dicionário com dados do item
+            item: Dados do item
             
         Returns:
             float: Percentual de lucro potencial ou None se não puder calcular
         """
         try:
-            price_csgoempire_usd = item.get('price')  # Já vem convertido em USD
-            price_buff163_usd = item.get('price_buff163')  # Já obtido pelo marketplace_scanner
+            price_csgoempire_usd = item.price  # Já vem convertido em USD
+            price_buff163_usd = item.price_buff163  # Já obtido pelo marketplace_scanner
             
             if price_csgoempire_usd is None:
                 logger.debug("Preço CSGOEmpire não disponível")
                 return None
             
             if price_buff163_usd is None:
-                logger.debug(f"Preço Buff163 não disponível para {item.get('name')}")
+                logger.debug("Preço Buff163 não disponível para %s", item.name)
                 return None
             
             # O preço já vem convertido em USD do marketplace_scanner
@@ -70,14 +69,14 @@ class ProfitFilter:
             # Calcula percentual de lucro
             profit_percentage = ((price_buff163_usd - price_csgoempire_usd) / price_csgoempire_usd) * 100
             
-            logger.debug(f"Lucro calculado: {profit_percentage:.2f}% para {item.get('name')}")
-            logger.debug(f"Preço CSGOEmpire: ${price_csgoempire_usd:.2f}")
-            logger.debug(f"Preço Buff163: ${price_buff163_usd:.2f}")
+            logger.debug("Lucro calculado: %.2f%% para %s", profit_percentage, item.name)
+            logger.debug("Preço CSGOEmpire: $%.2f", price_csgoempire_usd)
+            logger.debug("Preço Buff163: $%.2f", price_buff163_usd)
             
             return profit_percentage
             
         except Exception as e:
-            logger.error(f"Erro ao calcular potencial de lucro: {e}")
+            logger.error("Erro ao calcular potencial de lucro: %s", e)
             return None
     
     def get_min_profit_percentage(self) -> float:
@@ -87,7 +86,7 @@ class ProfitFilter:
     def set_min_profit_percentage(self, percentage: float):
         """Define o percentual mínimo de lucro."""
         self.min_profit_percentage = max(0.0, percentage)
-        logger.info(f"Percentual mínimo de lucro atualizado para {self.min_profit_percentage}%")
+        logger.info("Percentual mínimo de lucro atualizado para %s%%", self.min_profit_percentage)
     
     def get_coin_to_usd_factor(self) -> float:
         """Retorna o fator de conversão de coin para dólar."""
@@ -96,4 +95,4 @@ class ProfitFilter:
     def set_coin_to_usd_factor(self, factor: float):
         """Define o fator de conversão de coin para dólar."""
         self.coin_to_usd_factor = factor
-        logger.info(f"Fator de conversão coin->USD atualizado para {self.coin_to_usd_factor}")
+        logger.info("Fator de conversão coin->USD atualizado para %s", self.coin_to_usd_factor)
@@ -5,6 +5,7 @@ Servidor de health check para o Railway.
 import asyncio
 import logging
 import os
+import time
 from aiohttp import web
 from datetime import datetime
 
@@ -20,7 +21,8 @@ class HealthServer:
         self.port = port or int(os.getenv('PORT', 8000))
         self.app = web.Application()
         self.setup_routes()
-        self.start_time = datetime.now()
+        # Relógio monotônico: uptime imune a ajustes de NTP
+        self.start_time = time.monotonic()
     
     def setup_routes(self):
         """Configura as rotas do servidor."""
@@ -28,7 +30,7 @@ class HealthServer:
         async def health_check(request):
             """Endpoint de health check principal."""
             try:
-                uptime = (datetime.now() - self.start_time).total_seconds()
+                uptime = time.monotonic() - self.start_time
                 return web.json_response({
                     'status': 'healthy',
                     'timestamp': datetime.now().isoformat(),
@@ -47,7 +49,7 @@ class HealthServer:
         async def status(request):
             """Endpoint de status detalhado."""
             try:
-                uptime = (datetime.now() - self.start_time).total_seconds()
+                uptime = time.monotonic() - self.start_time
                 return web.json_response({
                     'status': 'running',
                     'timestamp': datetime.now().isoformat(),
@@ -84,9 +86,9 @@ class HealthServer:
         # Middleware para logging
         @web.middleware
         async def log_requests(request, handler):
-            start_time = datetime.now()
+            start_time = time.monotonic()
             response = await handler(request)
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.monotonic() - start_time
             logger.info(f"{request.method} {request.path} - {response.status} - {duration:.3f}s")
             return response
         
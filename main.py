@@ -22,6 +22,20 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+def setup_event_loop_policy():
+    """Configura a política do event loop (uvloop quando disponível)."""
+    if sys.platform == 'win32':
+        # uvloop não suporta Windows - usa o selector loop padrão
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        return
+    
+    try:
+        import uvloop
+        uvloop.install()
+        logger.info("⚡ uvloop instalado como event loop")
+    except ImportError:
+        logger.info("ℹ️ uvloop não disponível, usando event loop padrão do asyncio")
+
 async def start_health_server():
     """Inicia o servidor de health check em background."""
     try:
@@ -68,9 +82,7 @@ async def main():
         await scanner.run_forever()
         
     except Exception as e:
-        logger.error(f"❌ Erro fatal no main: {e}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("❌ Erro fatal no main: %s", e)
         sys.exit(1)
 
 async def shutdown(scanner, health_server=None):
@@ -96,6 +108,7 @@ async def shutdown(scanner, health_server=None):
 if __name__ == "__main__":
     try:
         # Executa o bot
+        setup_event_loop_policy()
         asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("🛑 Bot interrompido pelo usuário")
@@ -0,0 +1,8 @@
+"""
+Configuração dos testes: permite importar os módulos do bot a partir da raiz do repositório.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
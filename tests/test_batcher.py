@@ -0,0 +1,102 @@
+"""
+Testes do BatchLoader.
+"""
+
+import asyncio
+
+from utils.batcher import BatchLoader
+
+
+def test_cancelled_run_does_not_orphan_inflight_keys():
+    async def scenario():
+        started = asyncio.Event()
+
+        async def slow_fetch(keys):
+            started.set()
+            await asyncio.sleep(10)
+            return {}
+
+        loader = BatchLoader(slow_fetch, window=0)
+        runner = asyncio.create_task(loader.run())
+        first = asyncio.create_task(loader.load('ak'))
+        await started.wait()
+
+        # Cancela o loop no meio da consulta (como o disconnect() faz com os workers)
+        runner.cancel()
+        await asyncio.gather(runner, first, return_exceptions=True)
+        assert first.cancelled()
+        assert not loader._inflight
+
+        # Um novo loop atende a mesma chave com uma consulta nova
+        async def fetch(keys):
+            return {key: 1.0 for key in keys}
+
+        loader._fetch_many = fetch
+        runner = asyncio.create_task(loader.run())
+        try:
+            assert await asyncio.wait_for(loader.load('ak'), 1) == 1.0
+        finally:
+            runner.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_slow_batch_does_not_block_later_batches():
+    async def scenario():
+        release_slow = asyncio.Event()
+
+        async def fetch(keys):
+            if 'slow' in keys:
+                await release_slow.wait()
+            return {key: key.upper() for key in keys}
+
+        loader = BatchLoader(fetch, window=0)
+        runner = asyncio.create_task(loader.run())
+        try:
+            slow = asyncio.create_task(loader.load('slow'))
+            await asyncio.sleep(0)
+
+            # O lote seguinte é coletado e resolvido enquanto o primeiro ainda consulta
+            assert await asyncio.wait_for(loader.load('fast'), 1) == 'FAST'
+            assert not slow.done()
+
+            release_slow.set()
+            assert await asyncio.wait_for(slow, 1) == 'SLOW'
+        finally:
+            runner.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_failed_batch_propagates_the_error():
+    async def scenario():
+        async def failing_fetch(keys):
+            raise ConnectionError("supabase indisponível")
+
+        loader = BatchLoader(failing_fetch, window=0)
+        runner = asyncio.create_task(loader.run())
+        try:
+            results = await asyncio.gather(loader.load('ak'), loader.load('m4'), return_exceptions=True)
+            assert all(isinstance(result, ConnectionError) for result in results)
+            assert not loader._inflight
+        finally:
+            runner.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_exception_value_fails_only_its_key():
+    async def scenario():
+        async def fetch(keys):
+            return {'ak': 12.5, 'm4': TimeoutError("busca individual falhou")}
+
+        loader = BatchLoader(fetch, window=0.01)
+        runner = asyncio.create_task(loader.run())
+        try:
+            ak, m4 = await asyncio.gather(loader.load('ak'), loader.load('m4'), return_exceptions=True)
+            assert ak == 12.5
+            assert isinstance(m4, TimeoutError)
+        finally:
+            runner.cancel()
+
+    asyncio.run(scenario())
@@ -0,0 +1,27 @@
+"""
+Testes do SupabaseClient (buscas em lote).
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("supabase")
+
+from utils.supabase_client import SupabaseClient
+
+KEY = ("AK-47 | Redline", False, False, "Field-Tested")
+
+
+def _client_without_connection() -> SupabaseClient:
+    client = SupabaseClient.__new__(SupabaseClient)
+    client.client = None
+    return client
+
+
+@pytest.mark.parametrize("method", ["get_buff163_prices_bulk", "get_liquidity_scores_bulk"])
+def test_bulk_lookup_without_client_raises(method):
+    # Nenhuma consulta feita: não pode devolver "não encontrado" e alimentar o cache negativo
+    client = _client_without_connection()
+    with pytest.raises(RuntimeError):
+        asyncio.run(getattr(client, method)([KEY]))
@@ -0,0 +1,113 @@
+"""
+Agrupamento de consultas em lote para o Opportunity Bot.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Tuple
+
+
+class BatchLoader:
+    """
+    Junta consultas individuais feitas dentro de uma janela curta em uma única consulta em lote.
+
+    Chamadas concorrentes para uma chave ainda pendente compartilham o mesmo resultado.
+    Se a consulta do lote falhar, a exceção é propagada para todos os chamadores do lote;
+    uma exceção devolvida como valor de uma chave falha apenas aquela chave.
+    `run()` precisa estar rodando como task para que `load()` seja atendido.
+    """
+
+    def __init__(self, fetch_many: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]],
+                 max_batch_size: int = 50, window: float = 0.02, max_concurrent_batches: int = 4):
+        self._fetch_many = fetch_many
+        self.max_batch_size = max_batch_size
+        self.window = window  # segundos aguardando mais chaves para o lote
+        # Lotes consultados ao mesmo tempo - um lote lento não segura a coleta dos seguintes
+        self.max_concurrent_batches = max_concurrent_batches
+        self._queue: asyncio.Queue = asyncio.Queue()
+        # chave -> future da consulta em andamento (single-flight)
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        # task de cada lote em consulta -> entradas (chave, future) do lote
+        self._batches: Dict[asyncio.Task, List[Tuple[Hashable, asyncio.Future]]] = {}
+
+    async def load(self, key: Hashable) -> Any:
+        """Enfileira a chave para o próximo lote e aguarda o resultado (None se não encontrado, exceção se a consulta falhar)."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            self._queue.put_nowait((key, future))
+        # shield: cancelar um chamador não cancela o resultado dos demais
+        return await asyncio.shield(future)
+
+    async def run(self) -> None:
+        """Loop que agrupa as chaves pendentes e dispara cada lote como uma consulta própria."""
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(self.max_concurrent_batches)
+        batches = self._batches
+        try:
+            while True:
+                pending = []
+                try:
+                    pending.append(await queue.get())
+
+                    # Junta o que chegar dentro da janela, até o tamanho máximo do lote
+                    deadline = loop.time() + self.window
+                    while len(pending) < self.max_batch_size:
+                        timeout = deadline - loop.time()
+                        if timeout <= 0:
+                            break
+                        try:
+                            pending.append(await asyncio.wait_for(queue.get(), timeout))
+                        except asyncio.TimeoutError:
+                            break
+
+                    await slots.acquire()
+                except BaseException:
+                    self._release(pending)
+                    raise
+
+                # A coleta continua enquanto o lote é consultado
+                task = loop.create_task(self._resolve(pending, slots))
+                batches[task] = pending
+                task.add_done_callback(batches.pop)
+        finally:
+            # Cancelado no meio de lotes: nenhum future fica órfão - um load() posterior
+            # da mesma chave abre uma consulta nova
+            for task, pending in list(batches.items()):
+                task.cancel()
+                self._release(pending)
+
+    async def _resolve(self, pending: List[Tuple[Hashable, asyncio.Future]], slots: asyncio.Semaphore) -> None:
+        """Consulta um lote e resolve os futures das suas chaves."""
+        try:
+            keys = [key for key, _ in pending]
+            try:
+                results = await self._fetch_many(keys)
+            except Exception as e:
+                # A falha chega a quem aguarda as chaves do lote - não vira "não encontrado" (None)
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+            for key, future in pending:
+                if not future.done():
+                    result = results.get(key)
+                    # fetch_many pode devolver uma exceção como valor para falhar só aquela chave
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+        finally:
+            slots.release()
+            self._release(pending)
+
+    def _release(self, pending: List[Tuple[Hashable, asyncio.Future]]) -> None:
+        """Tira as chaves do lote de _inflight e cancela os futures que ficaram sem resultado."""
+        inflight = self._inflight
+        for key, future in pending:
+            if inflight.get(key) is future:
+                del inflight[key]
+            if not future.done():
+                future.cancel()
@@ -0,0 +1,35 @@
+"""
+Serialização JSON para o Opportunity Bot.
+Usa orjson quando disponível e cai para o módulo json da biblioteca padrão.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class _OrjsonModule:
+    """Expõe o orjson com a interface do módulo json (dumps retorna str)."""
+    
+    @staticmethod
+    def dumps(obj, *args, **kwargs) -> str:
+        # orjson já gera JSON compacto - argumentos como separators são ignorados
+        return orjson.dumps(obj).decode()
+    
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
+
+
+# Módulo compatível com json para o python-socketio/engineio
+json_module = _OrjsonModule if orjson is not None else json
+
+
+def dumps_bytes(obj) -> bytes:
+    """Serializa para bytes UTF-8, prontos para enviar como corpo de requisição HTTP."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
@@ -2,7 +2,9 @@
 Cliente Supabase para o Opportunity Bot.
 """
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 from supabase import create_client, Client
 from config.settings import Settings
@@ -15,6 +17,9 @@ class SupabaseClient:
     def __init__(self):
         self.settings = Settings()
         self.client: Optional[Client] = None
+        # O cliente supabase-py é síncrono (httpx bloqueante) - as consultas rodam neste pool
+        # para não travar o event loop enquanto aguardam a rede
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='supabase')
         self._initialize_client()
     
     def _initialize_client(self):
@@ -25,9 +30,9 @@ class SupabaseClient:
                 return
             
             # Inicialização mais simples e compatível
-            logger.info(f"🔧 Inicializando cliente Supabase...")
-            logger.info(f"   URL: {self.settings.SUPABASE_URL}")
-            logger.info(f"   Key: {self.settings.SUPABASE_KEY[:10]}...")
+            logger.info("🔧 Inicializando cliente Supabase...")
+            logger.info("   URL: %s", self.settings.SUPABASE_URL)
+            logger.info("   Key: %s...", self.settings.SUPABASE_KEY[:10])
             
             # Tenta inicialização básica
             self.client = create_client(
@@ -38,9 +43,7 @@ class SupabaseClient:
             logger.info("✅ Cliente Supabase inicializado")
             
         except Exception as e:
-            logger.error(f"❌ Erro ao inicializar cliente Supabase: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("❌ Erro ao inicializar cliente Supabase: %s", e)
             
             # Tenta inicialização alternativa
             try:
@@ -51,9 +54,13 @@ class SupabaseClient:
                 )
                 logger.info("✅ Cliente Supabase inicializado (método alternativo)")
             except Exception as e2:
-                logger.error(f"❌ Falha na inicialização alternativa: {e2}")
+                logger.error("❌ Falha na inicialização alternativa: %s", e2)
                 self.client = None
     
+    async def _execute(self, query) -> Any:
+        """Executa uma consulta PostgREST no pool de threads e retorna a resposta."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, query.execute)
+    
     async def get_buff163_price(self, market_hash_name: str) -> Optional[float]:
         """
         Obtém apenas o preço do Buff163 para um item.
@@ -69,33 +76,33 @@ class SupabaseClient:
                 logger.error("❌ Cliente Supabase não inicializado")
                 return None
             
-            logger.info(f"🔍 Buscando preço Buff163 para: '{market_hash_name}'")
+            logger.debug("🔍 Buscando preço Buff163 para: '%s'", market_hash_name)
             
             # Primeira tentativa: busca exata
-            response = self.client.table('market_data').select(
+            response = await self._execute(self.client.table('market_data').select(
                 'price_buff163'
-            ).eq('item_key', market_hash_name).execute()
+            ).eq('item_key', market_hash_name))
             
-            logger.info(f"📊 Busca exata - Resposta: {response.data}")
+            logger.debug("📊 Busca exata - Resposta: %s", response.data)
             
             if response.data and len(response.data) > 0:
                 price_buff163 = response.data[0].get('price_buff163')
                 if price_buff163 is not None:
-                    logger.info(f"✅ Preço Buff163 encontrado (busca exata): ${price_buff163}")
+                    logger.debug("✅ Preço Buff163 encontrado (busca exata): $%s", price_buff163)
                     return float(price_buff163)
             
             # Segunda tentativa: busca por similaridade (contains)
-            logger.info(f"🔍 Tentando busca por similaridade...")
-            response = self.client.table('market_data').select(
+            logger.debug("🔍 Tentando busca por similaridade...")
+            response = await self._execute(self.client.table('market_data').select(
                 'item_key, price_buff163'
-            ).ilike('item_key', f'%{market_hash_name}%').limit(5).execute()
+            ).ilike('item_key', f'%{market_hash_name}%').limit(5))
             
-            logger.info(f"📊 Busca por similaridade - Resposta: {response.data}")
+            logger.debug("📊 Busca por similaridade - Resposta: %s", response.data)
             
             if response.data and len(response.data) > 0:
                 # Mostra todos os itens similares encontrados
                 for i, item in enumerate(response.data):
-                    logger.info(f"📊 Item similar {i+1}: '{item.get('item_key')}' - Preço: ${item.get('price_buff163')}")
+                    logger.debug("📊 Item similar %s: '%s' - Preço: $%s", i+1, item.get('item_key'), item.get('price_buff163'))
                 
                 # Tenta encontrar o mais similar
                 for item in response.data:
@@ -103,16 +110,14 @@ class SupabaseClient:
                     if market_hash_name.lower() in item_key.lower():
                         price_buff163 = item.get('price_buff163')
                         if price_buff163 is not None:
-                            logger.info(f"✅ Preço Buff163 encontrado (similaridade): ${price_buff163}")
+                            logger.debug("✅ Preço Buff163 encontrado (similaridade): $%s", price_buff163)
                             return float(price_buff163)
             
-            logger.warning(f"⚠️ Nenhum preço Buff163 encontrado para: '{market_hash_name}'")
+            logger.warning("⚠️ Nenhum preço Buff163 encontrado para: '%s'", market_hash_name)
             return None
             
         except Exception as e:
-            logger.error(f"❌ Erro ao buscar preço Buff163: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("❌ Erro ao buscar preço Buff163: %s", e)
             return None
     
     async def get_liquidity_score(self, market_hash_name: str) -> Optional[float]:
@@ -130,33 +135,33 @@ class SupabaseClient:
                 logger.error("❌ Cliente Supabase não inicializado")
                 return None
             
-            logger.info(f"🔍 Buscando score de liquidez para: '{market_hash_name}'")
+            logger.debug("🔍 Buscando score de liquidez para: '%s'", market_hash_name)
             
             # Primeira tentativa: busca exata
-            response = self.client.table('liquidity').select(
+            response = await self._execute(self.client.table('liquidity').select(
                 'liquidity_score'
-            ).eq('item_key', market_hash_name).execute()
+            ).eq('item_key', market_hash_name))
             
-            logger.info(f"📊 Busca exata - Resposta: {response.data}")
+            logger.debug("📊 Busca exata - Resposta: %s", response.data)
             
             if response.data and len(response.data) > 0:
                 liquidity_score = response.data[0].get('liquidity_score')
                 if liquidity_score is not None:
-                    logger.info(f"✅ Score de liquidez encontrado (busca exata): {liquidity_score}")
+                    logger.debug("✅ Score de liquidez encontrado (busca exata): %s", liquidity_score)
                     return float(liquidity_score)
             
             # Segunda tentativa: busca por similaridade (contains)
-            logger.info(f"🔍 Tentando busca por similaridade...")
-            response = self.client.table('liquidity').select(
+            logger.debug("🔍 Tentando busca por similaridade...")
+            response = await self._execute(self.client.table('liquidity').select(
                 'item_key, liquidity_score'
-            ).ilike('item_key', f'%{market_hash_name}%').limit(5).execute()
+            ).ilike('item_key', f'%{market_hash_name}%').limit(5))
             
-            logger.info(f"📊 Busca por similaridade - Resposta: {response.data}")
+            logger.debug("📊 Busca por similaridade - Resposta: %s", response.data)
             
             if response.data and len(response.data) > 0:
                 # Mostra todos os itens similares encontrados
                 for i, item in enumerate(response.data):
-                    logger.info(f"📊 Item similar {i+1}: '{item.get('item_key')}' - Liquidez: {item.get('liquidity_score')}")
+                    logger.debug("📊 Item similar %s: '%s' - Liquidez: %s", i+1, item.get('item_key'), item.get('liquidity_score'))
                 
                 # Tenta encontrar o mais similar
                 for item in response.data:
@@ -164,16 +169,14 @@ class SupabaseClient:
                     if market_hash_name.lower() in item_key.lower():
                         liquidity_score = item.get('liquidity_score')
                         if liquidity_score is not None:
-                            logger.info(f"✅ Score de liquidez encontrado (similaridade): {liquidity_score}")
+                            logger.debug("✅ Score de liquidez encontrado (similaridade): %s", liquidity_score)
                             return float(liquidity_score)
             
-            logger.warning(f"⚠️ Nenhum score de liquidez encontrado para: '{market_hash_name}'")
+            logger.warning("⚠️ Nenhum score de liquidez encontrado para: '%s'", market_hash_name)
             return None
             
         except Exception as e:
-            logger.error(f"❌ Erro ao buscar score de liquidez: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("❌ Erro ao buscar score de liquidez: %s", e)
             return None
     
     async def log_opportunity(self, item: Dict, marketplace: str, profit_potential: float):
@@ -202,16 +205,16 @@ class SupabaseClient:
             
             # Insere na tabela de oportunidades (se existir)
             try:
-                response = self.client.table('opportunities').insert(opportunity_data).execute()
+                response = await self._execute(self.client.table('opportunities').insert(opportunity_data))
                 if response.data:
-                    logger.info(f"✅ Oportunidade registrada na database: {item.get('name')}")
+                    logger.info("✅ Oportunidade registrada na database: %s", item.get('name'))
                 else:
                     logger.warning("⚠️ Falha ao registrar oportunidade na database")
             except Exception as e:
-                logger.warning(f"⚠️ Tabela opportunities não encontrada, pulando log: {e}")
+                logger.warning("⚠️ Tabela opportunities não encontrada, pulando log: %s", e)
                 
         except Exception as e:
-            logger.error(f"❌ Erro ao registrar oportunidade: {e}")
+            logger.error("❌ Erro ao registrar oportunidade: %s", e)
     
     def is_connected(self) -> bool:
         """Verifica se o cliente está conectado."""
@@ -227,33 +230,31 @@ class SupabaseClient:
             
             # Testa tabela market_data
             try:
-                response = self.client.table('market_data').select('item_key, price_buff163').limit(1).execute()
-                logger.info(f"✅ Tabela market_data acessível: {len(response.data)} registros encontrados")
+                response = await self._execute(self.client.table('market_data').select('item_key, price_buff163').limit(1))
+                logger.info("✅ Tabela market_data acessível: %s registros encontrados", len(response.data))
                 if response.data:
                     sample_item = response.data[0]
-                    logger.info(f"📊 Exemplo de item: item_key='{sample_item.get('item_key')}', price_buff163={sample_item.get('price_buff163')}")
+                    logger.info("📊 Exemplo de item: item_key='%s', price_buff163=%s", sample_item.get('item_key'), sample_item.get('price_buff163'))
             except Exception as e:
-                logger.error(f"❌ Erro ao acessar tabela market_data: {e}")
+                logger.error("❌ Erro ao acessar tabela market_data: %s", e)
                 return False
             
             # Testa tabela liquidity
             try:
-                response = self.client.table('liquidity').select('item_key, liquidity_score').limit(1).execute()
-                logger.info(f"✅ Tabela liquidity acessível: {len(response.data)} registros encontrados")
+                response = await self._execute(self.client.table('liquidity').select('item_key, liquidity_score').limit(1))
+                logger.info("✅ Tabela liquidity acessível: %s registros encontrados", len(response.data))
                 if response.data:
                     sample_item = response.data[0]
-                    logger.info(f"📊 Exemplo de item: item_key='{sample_item.get('item_key')}', liquidity_score={sample_item.get('liquidity_score')}")
+                    logger.info("📊 Exemplo de item: item_key='%s', liquidity_score=%s", sample_item.get('item_key'), sample_item.get('liquidity_score'))
             except Exception as e:
-                logger.error(f"❌ Erro ao acessar tabela liquidity: {e}")
+                logger.error("❌ Erro ao acessar tabela liquidity: %s", e)
                 return False
             
             logger.info("✅ Conexão com Supabase testada com sucesso")
             return True
             
         except Exception as e:
-            logger.error(f"❌ Teste de conexão falhou: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("❌ Teste de conexão falhou: %s", e)
             return False
 
     async def get_buff163_price_advanced(self, base_name: str, is_stattrak: bool, is_souvenir: bool, condition: str) -> Optional[float]:
@@ -272,16 +273,16 @@ class SupabaseClient:
         """
         try:
             if not self.client:
-                logger.error("❌ Cliente Supabase não inicializado")
-                return None
+                # Sem cliente nenhuma consulta foi feita - não pode virar "não encontrado"
+                raise RuntimeError("Cliente Supabase não inicializado")
             
-            logger.info(f"🔍 Buscando preço Buff163 para: {base_name}")
-            logger.info(f"   - StatTrak: {is_stattrak}")
-            logger.info(f"   - Souvenir: {is_souvenir}")
-            logger.info(f"   - Condição: {condition}")
+            logger.debug("🔍 Buscando preço Buff163 para: %s", base_name)
+            logger.debug("   - StatTrak: %s", is_stattrak)
+            logger.debug("   - Souvenir: %s", is_souvenir)
+            logger.debug("   - Condição: %s", condition)
             
             # Primeira tentativa: busca usando os campos separados (mesma lógica do bot principal)
-            logger.info(f"🔍 Buscando por campos separados...")
+            logger.debug("🔍 Buscando por campos separados...")
             
             # Remove parênteses da condição se presente (para compatibilidade)
             clean_condition = condition
@@ -304,40 +305,40 @@ class SupabaseClient:
             if clean_condition:
                 query = query.eq('condition', clean_condition)
             
-            response = query.execute()
-            logger.info(f"📊 Busca por campos separados - Resposta: {response.data}")
+            response = await self._execute(query)
+            logger.debug("📊 Busca por campos separados - Resposta: %s", response.data)
             
             if response.data and len(response.data) > 0:
                 price_buff163 = response.data[0].get('price_buff163')
                 if price_buff163 is not None:
-                    logger.info(f"✅ Preço Buff163 encontrado (campos separados): ${price_buff163}")
+                    logger.debug("✅ Preço Buff163 encontrado (campos separados): $%s", price_buff163)
                     return float(price_buff163)
             
             # Segunda tentativa: busca usando item_key construído (formato antigo)
             market_data_name = self._build_market_data_name(base_name, is_stattrak, is_souvenir, condition)
-            logger.info(f"🔍 Tentando busca por item_key: '{market_data_name}'")
+            logger.debug("🔍 Tentando busca por item_key: '%s'", market_data_name)
             
-            response = self.client.table('market_data').select('price_buff163').eq('item_key', market_data_name).execute()
-            logger.info(f"📊 Busca por item_key - Resposta: {response.data}")
+            response = await self._execute(self.client.table('market_data').select('price_buff163').eq('item_key', market_data_name))
+            logger.debug("📊 Busca por item_key - Resposta: %s", response.data)
             
             if response.data and len(response.data) > 0:
                 price_buff163 = response.data[0].get('price_buff163')
                 if price_buff163 is not None:
-                    logger.info(f"✅ Preço Buff163 encontrado (item_key): ${price_buff163}")
+                    logger.debug("✅ Preço Buff163 encontrado (item_key): $%s", price_buff163)
                     return float(price_buff163)
             
             # Terceira tentativa: busca por similaridade usando name_base
-            logger.info(f"🔍 Tentando busca por similaridade...")
-            response = self.client.table('market_data').select('item_key, price_buff163, name_base, stattrak, souvenir, condition').ilike('name_base', f'%{base_name}%').limit(10).execute()
+            logger.debug("🔍 Tentando busca por similaridade...")
+            response = await self._execute(self.client.table('market_data').select('item_key, price_buff163, name_base, stattrak, souvenir, condition').ilike('name_base', f'%{base_name}%').limit(10))
             
-            logger.info(f"📊 Busca por similaridade - Resposta: {response.data}")
+            logger.debug("📊 Busca por similaridade - Resposta: %s", response.data)
             
             if response.data and len(response.data) > 0:
                 # Mostra todos os itens similares encontrados
-                logger.info(f"📊 Itens similares encontrados:")
+                logger.debug("📊 Itens similares encontrados:")
                 for i, item in enumerate(response.data):
-                    logger.info(f"   {i+1}. '{item.get('item_key')}' - Preço: ${item.get('price_buff163')}")
-                    logger.info(f"      name_base: {item.get('name_base')}, stattrak: {item.get('stattrak')}, souvenir: {item.get('souvenir')}, condition: {item.get('condition')}")
+                    logger.debug("   %s. '%s' - Preço: $%s", i+1, item.get('item_key'), item.get('price_buff163'))
+                    logger.debug("      name_base: %s, stattrak: %s, souvenir: %s, condition: %s", item.get('name_base'), item.get('stattrak'), item.get('souvenir'), item.get('condition'))
                 
                 # Tenta encontrar o mais similar
                 for item in response.data:
@@ -354,7 +355,7 @@ class SupabaseClient:
                         
                         price_buff163 = item.get('price_buff163')
                         if price_buff163 is not None:
-                            logger.info(f"✅ Preço Buff163 encontrado por similaridade (campos exatos): ${price_buff163}")
+                            logger.debug("✅ Preço Buff163 encontrado por similaridade (campos exatos): $%s", price_buff163)
                             return float(price_buff163)
                 
                 # Se não encontrou exato, aceita o primeiro com name_base igual
@@ -362,17 +363,16 @@ class SupabaseClient:
                     if item.get('name_base') == base_name:
                         price_buff163 = item.get('price_buff163')
                         if price_buff163 is not None:
-                            logger.info(f"✅ Preço Buff163 encontrado por fallback (name_base): ${price_buff163}")
+                            logger.debug("✅ Preço Buff163 encontrado por fallback (name_base): $%s", price_buff163)
                             return float(price_buff163)
             
-            logger.warning(f"⚠️ Nenhum preço Buff163 encontrado para: {base_name}")
+            logger.warning("⚠️ Nenhum preço Buff163 encontrado para: %s", base_name)
             return None
             
         except Exception as e:
-            logger.error(f"❌ Erro ao buscar preço Buff163: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            return None
+            # Propaga: a busca em lote trata a falha só para este item
+            logger.exception("❌ Erro ao buscar preço Buff163: %s", e)
+            raise
     
     async def get_liquidity_score_advanced(self, base_name: str, is_stattrak: bool, is_souvenir: bool, condition: str) -> Optional[float]:
         """
@@ -389,38 +389,38 @@ class SupabaseClient:
         """
         try:
             if not self.client:
-                logger.error("❌ Cliente Supabase não inicializado")
-                return None
+                # Sem cliente nenhuma consulta foi feita - não pode virar "não encontrado"
+                raise RuntimeError("Cliente Supabase não inicializado")
             
-            logger.info(f"🔍 Buscando score de liquidez para: {base_name}")
-            logger.info(f"   - StatTrak: {is_stattrak}")
-            logger.info(f"   - Souvenir: {is_souvenir}")
-            logger.info(f"   - Condição: {condition}")
+            logger.debug("🔍 Buscando score de liquidez para: %s", base_name)
+            logger.debug("   - StatTrak: %s", is_stattrak)
+            logger.debug("   - Souvenir: %s", is_souvenir)
+            logger.debug("   - Condição: %s", condition)
             
             # Constrói o nome no formato da tabela liquidity
             liquidity_name = self._build_liquidity_name(base_name, is_stattrak, is_souvenir, condition)
-            logger.info(f"🔍 Nome para busca na tabela liquidity: '{liquidity_name}'")
+            logger.debug("🔍 Nome para busca na tabela liquidity: '%s'", liquidity_name)
             
             # Busca usando o nome construído
-            response = self.client.table('liquidity').select('liquidity_score').eq('item_key', liquidity_name).execute()
+            response = await self._execute(self.client.table('liquidity').select('liquidity_score').eq('item_key', liquidity_name))
             
-            logger.info(f"📊 Resposta da database: {response.data}")
-            logger.info(f"📊 Número de registros encontrados: {len(response.data) if response.data else 0}")
+            logger.debug("📊 Resposta da database: %s", response.data)
+            logger.debug("📊 Número de registros encontrados: %s", len(response.data) if response.data else 0)
             
             if response.data and len(response.data) > 0:
                 liquidity_score = response.data[0].get('liquidity_score')
                 if liquidity_score is not None:
-                    logger.info(f"✅ Score de liquidez encontrado: {liquidity_score}")
+                    logger.debug("✅ Score de liquidez encontrado: %s", liquidity_score)
                     return float(liquidity_score)
             
             # Se não encontrou, tenta busca por similaridade
-            logger.info(f"🔍 Tentando busca por similaridade...")
-            response = self.client.table('liquidity').select('item_key, liquidity_score').ilike('item_key', f'%{base_name}%').limit(10).execute()
+            logger.debug("🔍 Tentando busca por similaridade...")
+            response = await self._execute(self.client.table('liquidity').select('item_key, liquidity_score').ilike('item_key', f'%{base_name}%').limit(10))
             
             if response.data and len(response.data) > 0:
-                logger.info(f"📊 Itens similares encontrados:")
+                logger.debug("📊 Itens similares encontrados:")
                 for i, item in enumerate(response.data):
-                    logger.info(f"   {i+1}. '{item.get('item_key')}' - Liquidez: {item.get('liquidity_score')}")
+                    logger.debug("   %s. '%s' - Liquidez: %s", i+1, item.get('item_key'), item.get('liquidity_score'))
                 
                 # Tenta encontrar o mais similar
                 for item in response.data:
@@ -428,17 +428,120 @@ class SupabaseClient:
                     if self._is_similar_item(item_key, base_name, is_stattrak, is_souvenir, condition):
                         liquidity_score = item.get('liquidity_score')
                         if liquidity_score is not None:
-                            logger.info(f"✅ Score de liquidez encontrado por similaridade: {liquidity_score}")
+                            logger.debug("✅ Score de liquidez encontrado por similaridade: %s", liquidity_score)
                             return float(liquidity_score)
             
-            logger.warning(f"⚠️ Nenhum score de liquidez encontrado para: {base_name}")
+            logger.warning("⚠️ Nenhum score de liquidez encontrado para: %s", base_name)
             return None
             
         except Exception as e:
-            logger.error(f"❌ Erro ao buscar score de liquidez: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            return None
+            # Propaga: a busca em lote trata a falha só para este item
+            logger.exception("❌ Erro ao buscar score de liquidez: %s", e)
+            raise
+    
+    async def get_buff163_prices_bulk(self, keys: List[tuple]) -> Dict[tuple, Optional[float]]:
+        """
+        Obtém os preços Buff163 de vários itens com uma única consulta pelos campos separados.
+        Itens sem correspondência exata caem na busca individual (item_key e similaridade).
+        
+        Args:
+            keys: Lista de tuplas (base_name, is_stattrak, is_souvenir, condition)
+            
+        Returns:
+            Dict: Tupla do item -> preço Buff163 em dólar (None se não encontrado; a exceção, se a busca individual falhou)
+        """
+        try:
+            if not self.client:
+                # Sem cliente nenhuma consulta foi feita - não pode virar "não encontrado"
+                raise RuntimeError("Cliente Supabase não inicializado")
+            
+            base_names = list({key[0] for key in keys})
+            logger.debug("🔍 Buscando preço Buff163 em lote: %s itens", len(keys))
+            
+            response = await self._execute(self.client.table('market_data').select('name_base, stattrak, souvenir, condition, price_buff163').in_('name_base', base_names))
+            
+            # Primeira linha com preço para cada combinação de campos (mesma regra da busca individual)
+            found = {}
+            for row in response.data or []:
+                if row.get('price_buff163') is None:
+                    continue
+                found.setdefault((row.get('name_base'), row.get('stattrak'), row.get('souvenir'), row.get('condition')), row.get('price_buff163'))
+                found.setdefault((row.get('name_base'), row.get('stattrak'), row.get('souvenir'), None), row.get('price_buff163'))
+            
+            results = {}
+            missing = []
+            for key in keys:
+                base_name, is_stattrak, is_souvenir, condition = key
+                
+                # Remove parênteses da condição se presente (para compatibilidade)
+                clean_condition = condition
+                if condition and condition.startswith('(') and condition.endswith(')'):
+                    clean_condition = condition[1:-1].strip()
+                
+                price_buff163 = found.get((base_name, is_stattrak, is_souvenir, clean_condition or None))
+                if price_buff163 is not None:
+                    results[key] = float(price_buff163)
+                else:
+                    missing.append(key)
+            
+            # Buscas individuais em paralelo - cada uma pode fazer até 3 consultas, e em série
+            # um lote com muitos itens ausentes seguraria todos os lotes seguintes
+            # A falha de uma busca individual fica só naquela chave (a exceção vai como valor)
+            if missing:
+                prices = await asyncio.gather(*(self.get_buff163_price_advanced(*key) for key in missing), return_exceptions=True)
+                results.update(zip(missing, prices))
+            
+            return results
+            
+        except Exception as e:
+            # Propaga: para quem chama, falha de consulta não pode parecer "item não encontrado"
+            logger.error("❌ Erro ao buscar preços Buff163 em lote: %s", e)
+            raise
+    
+    async def get_liquidity_scores_bulk(self, keys: List[tuple]) -> Dict[tuple, Optional[float]]:
+        """
+        Obtém os scores de liquidez de vários itens com uma única consulta.
+        Itens sem correspondência exata caem na busca individual (com similaridade).
+        
+        Args:
+            keys: Lista de tuplas (base_name, is_stattrak, is_souvenir, condition)
+            
+        Returns:
+            Dict: Tupla do item -> score de liquidez (None se não encontrado; a exceção, se a busca individual falhou)
+        """
+        try:
+            if not self.client:
+                # Sem cliente nenhuma consulta foi feita - não pode virar "não encontrado"
+                raise RuntimeError("Cliente Supabase não inicializado")
+            
+            names = {key: self._build_liquidity_name(*key) for key in keys}
+            logger.debug("🔍 Buscando score de liquidez em lote: %s itens", len(names))
+            
+            response = await self._execute(self.client.table('liquidity').select('item_key, liquidity_score').in_('item_key', list(set(names.values()))))
+            found = {row.get('item_key'): row.get('liquidity_score') for row in response.data or []}
+            
+            results = {}
+            missing = []
+            for key, liquidity_name in names.items():
+                liquidity_score = found.get(liquidity_name)
+                if liquidity_score is not None:
+                    results[key] = float(liquidity_score)
+                else:
+                    missing.append(key)
+            
+            # Buscas individuais em paralelo - em série, um lote com muitos itens ausentes
+            # seguraria todas as consultas de liquidez seguintes
+            # A falha de uma busca individual fica só naquela chave (a exceção vai como valor)
+            if missing:
+                scores = await asyncio.gather(*(self.get_liquidity_score_advanced(*key) for key in missing), return_exceptions=True)
+                results.update(zip(missing, scores))
+            
+            return results
+            
+        except Exception as e:
+            # Propaga: para quem chama, falha de consulta não pode parecer "item não encontrado"
+            logger.error("❌ Erro ao buscar scores de liquidez em lote: %s", e)
+            raise
     
     def _build_liquidity_name(self, base_name: str, is_stattrak: bool, is_souvenir: bool, condition: str) -> str:
         """
@@ -473,11 +576,11 @@ class SupabaseClient:
             elif condition:
                 liquidity_name = f"{liquidity_name}|{condition}"
             
-            logger.info(f"🔧 Nome construído para liquidity: '{liquidity_name}'")
+            logger.debug("🔧 Nome construído para liquidity: '%s'", liquidity_name)
             return liquidity_name
             
         except Exception as e:
-            logger.error(f"❌ Erro ao construir nome para liquidity: {e}")
+            logger.error("❌ Erro ao construir nome para liquidity: %s", e)
             return base_name
     
     def _is_similar_item(self, item_key: str, base_name: str, is_stattrak: bool, is_souvenir: bool, condition: str) -> bool:
@@ -521,7 +624,7 @@ class SupabaseClient:
             return True
             
         except Exception as e:
-            logger.error(f"❌ Erro ao verificar similaridade: {e}")
+            logger.error("❌ Erro ao verificar similaridade: %s", e)
             return False
 
     def _build_market_data_name(self, base_name: str, is_stattrak: bool, is_souvenir: bool, condition: str) -> str:
@@ -561,11 +664,11 @@ class SupabaseClient:
             elif condition:
                 market_data_name = f"{market_data_name}|{condition}"
             
-            logger.info(f"🔧 Nome construído para market_data: '{market_data_name}'")
+            logger.debug("🔧 Nome construído para market_data: '%s'", market_data_name)
             return market_data_name
             
         except Exception as e:
-            logger.error(f"❌ Erro ao construir nome para market_data: {e}")
+            logger.error("❌ Erro ao construir nome para market_data: %s", e)
             return base_name
     
     def _is_similar_market_data_item(self, item_key: str, base_name: str, is_stattrak: bool, is_souvenir: bool, condition: str) -> bool:
@@ -609,5 +712,5 @@ class SupabaseClient:
             return True
             
         except Exception as e:
-            logger.error(f"❌ Erro ao verificar similaridade: {e}")
+            logger.error("❌ Erro ao verificar similaridade: %s", e)
             return False
@@ -0,0 +1,46 @@
+"""
+Cache em memória com expiração por tempo para o Opportunity Bot.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Cache LRU limitado em tamanho, com expiração por entrada (relógio monotônico)."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # chave -> (valor, instante de expiração)
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Retorna o valor em cache ou `default` se ausente/expirado."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Armazena um valor, descartando o menos usado recentemente se o cache estiver cheio."""
+        data = self._data
+        data[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl))
+        data.move_to_end(key)
+        if len(data) > self.maxsize:
+            data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove todas as entradas."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)